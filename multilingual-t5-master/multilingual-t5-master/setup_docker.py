@@ -5,34 +5,140 @@ Helps configure the environment and run the project
 """
 
 import subprocess
+import hashlib
+import re
 import sys
 import os
+import shutil
 import platform
 
+def binary_version(path):
+    """Return the --version output of a binary, bounded by a short timeout"""
+    try:
+        result = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=2)
+    except (OSError, subprocess.TimeoutExpired):
+        return path
+    return result.stdout.strip() or path
+
 def check_docker():
     """Check if Docker is installed"""
-    try:
-        result = subprocess.run(["docker", "--version"], capture_output=True, text=True)
-        print(f"✓ Docker found: {result.stdout.strip()}")
-        return True
-    except FileNotFoundError:
+    path = shutil.which("docker")
+    if path is None:
         print("✗ Docker not found. Please install Docker Desktop.")
         return False
+    print(f"✓ Docker found: {binary_version(path)}")
+    return True
 
 def check_docker_compose():
     """Check if Docker Compose is installed"""
-    try:
-        result = subprocess.run(["docker-compose", "--version"], capture_output=True, text=True)
-        print(f"✓ Docker Compose found: {result.stdout.strip()}")
-        return True
-    except FileNotFoundError:
+    path = shutil.which("docker-compose")
+    if path is None:
         print("✗ Docker Compose not found.")
         return False
+    print(f"✓ Docker Compose found: {binary_version(path)}")
+    return True
+
+IMAGE_NAME = "multilingual-t5:latest"
+
+def pattern_regex(pattern):
+    """Compile a .dockerignore pattern (Go filepath.Match syntax plus **)"""
+    parts = []
+    for token in re.split(r"(\*\*/?|\*|\?)", pattern):
+        if token == "**/":
+            parts.append("(?:.*/)?")
+        elif token == "**":
+            parts.append(".*")
+        elif token == "*":
+            parts.append("[^/]*")
+        elif token == "?":
+            parts.append("[^/]")
+        else:
+            parts.append(re.escape(token))
+    return re.compile("".join(parts) + r"\Z")
+
+def dockerignore_rules(path=".dockerignore"):
+    """Read .dockerignore as (regex, excluded) rules, in file order"""
+    rules = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return rules
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        excluded = not line.startswith("!")
+        pattern = line if excluded else line[1:].strip()
+        pattern = os.path.normpath(pattern).replace(os.sep, "/").lstrip("/")
+        rules.append((pattern_regex(pattern), excluded))
+    return rules
+
+def is_ignored(path, rules):
+    """Apply the rules like docker: the last rule matching the path or a parent wins"""
+    parents = path.split("/")
+    candidates = ["/".join(parents[:i]) for i in range(1, len(parents) + 1)]
+    ignored = False
+    for regex, excluded in rules:
+        if any(regex.match(candidate) for candidate in candidates):
+            ignored = excluded
+    return ignored
+
+def context_files():
+    """List files docker sends as the build context (".", minus .dockerignore)"""
+    rules = dockerignore_rules()
+    # Without "!" rules nothing below an ignored directory can be re-included
+    can_prune = all(excluded for _, excluded in rules)
+    files = []
+    for root, dirs, names in os.walk("."):
+        rel_root = os.path.relpath(root, ".").replace(os.sep, "/")
+        prefix = "" if rel_root == "." else rel_root + "/"
+        if can_prune:
+            dirs[:] = [d for d in dirs if not is_ignored(prefix + d, rules)]
+        files.extend(prefix + name for name in names if not is_ignored(prefix + name, rules))
+    # Docker always sends these, even when .dockerignore excludes them
+    for name in ("Dockerfile", ".dockerignore"):
+        if os.path.exists(name) and name not in files:
+            files.append(name)
+    return sorted(files)
+
+def context_hash():
+    """Hash the path, mtime and size of every file in the build context"""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in context_files():
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        digest.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    return digest.hexdigest()
+
+def image_context_hash():
+    """Return the ctx_hash label of the existing image, or None"""
+    docker = shutil.which("docker")
+    if docker is None:
+        return None
+    try:
+        result = subprocess.run(
+            [docker, "image", "inspect", "-f",
+             '{{index .Config.Labels "ctx_hash"}}', IMAGE_NAME],
+            capture_output=True, text=True)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
 
 def build_docker_image():
-    """Build Docker image"""
+    """Build Docker image, skipping the build when the context is unchanged"""
+    ctx_hash = context_hash()
+    if image_context_hash() == ctx_hash:
+        print("\n✓ Image up-to-date")
+        return True
+
     print("\nBuilding Docker image...")
-    result = subprocess.run(["docker", "build", "-t", "multilingual-t5:latest", "."])
+    result = subprocess.run(
+        ["docker", "build", "--label", f"ctx_hash={ctx_hash}", "-t", IMAGE_NAME, "."])
     return result.returncode == 0
 
 def run_docker_container():
@@ -89,7 +195,11 @@ def main():
         subprocess.run(["docker-compose", "exec", "mt5", "bash"])
     
     elif choice == "4":
-        print("\n" + open("DOCKER_SETUP.md").read())
+        print()
+        sys.stdout.flush()
+        with open("DOCKER_SETUP.md", "rb") as f:
+            shutil.copyfileobj(f, sys.stdout.buffer, length=65536)
+        sys.stdout.buffer.flush()
     
     elif choice == "5":
         print("Exiting...")
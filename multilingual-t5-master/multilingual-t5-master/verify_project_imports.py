@@ -1,25 +1,47 @@
 
 import sys
 import os
+import importlib
+import importlib.util
+import site
 
-# Ensure the current directory is in the path so we can import the local package
-sys.path.append(os.getcwd())
+def find_spec(name):
+    """Locate a module without importing it; None if it cannot be found."""
+    try:
+        return importlib.util.find_spec(name)
+    except ImportError:
+        return None
+
+# Only add the current directory when the package is not already importable
+# (e.g. an editable install or an installed wheel).
+if find_spec("multilingual_t5") is None:
+    site.addsitedir(os.getcwd())
+    importlib.invalidate_caches()
 
 print("Attempting to import multilingual_t5...")
+if find_spec("multilingual_t5") is None:
+    print("FAILURE: Could not import multilingual_t5. Error: package not found on sys.path")
+    sys.exit(1)
+
 try:
-    import multilingual_t5
+    # Importing the submodule initialises the parent package as a side effect,
+    # so the package itself is only imported once.
+    importlib.import_module("multilingual_t5.tasks")
+    tasks_error = None
+except Exception as e:
+    tasks_error = e
+
+multilingual_t5 = sys.modules.get("multilingual_t5")
+if multilingual_t5 is not None:
     print("SUCCESS: multilingual_t5 imported.")
     print(f"Package location: {multilingual_t5.__file__}")
-except ImportError as e:
-    print(f"FAILURE: Could not import multilingual_t5. Error: {e}")
-except Exception as e:
-    print(f"FAILURE: Unexpected error. Error: {e}")
+else:
+    print(f"FAILURE: Could not import multilingual_t5. Error: {tasks_error}")
 
 print("Attempting to import multilingual_t5.tasks...")
-try:
-    import multilingual_t5.tasks
+if tasks_error is None:
     print("SUCCESS: multilingual_t5.tasks imported.")
-except ImportError as e:
-    print(f"FAILURE: Could not import multilingual_t5.tasks. Error: {e}")
-except Exception as e:
-    print(f"FAILURE: Unexpected error. Error: {e}")
+elif isinstance(tasks_error, ImportError):
+    print(f"FAILURE: Could not import multilingual_t5.tasks. Error: {tasks_error}")
+else:
+    print(f"FAILURE: Unexpected error. Error: {tasks_error}")
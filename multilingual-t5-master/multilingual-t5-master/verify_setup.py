@@ -1,21 +1,40 @@
 
 import sys
-import pkg_resources
+import io
+import importlib
+import contextlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import version as dist_version, PackageNotFoundError
+
+_print_lock = threading.Lock()
 
 def check_import(module_name):
+    """Import a module once; return (name, success, version, error)."""
     try:
-        __import__(module_name)
-        print(f"SUCCESS: {module_name} imported.")
-        try:
-            mod = __import__(module_name)
-            if hasattr(mod, '__version__'):
-                print(f"  Version: {mod.__version__}")
-        except:
-            pass
+        mod = importlib.import_module(module_name)
     except ImportError as e:
-        print(f"FAILURE: Could not import {module_name}. Error: {e}")
+        return module_name, False, None, f"Could not import {module_name}. Error: {e}"
     except Exception as e:
-        print(f"FAILURE: Error observing {module_name}. Error: {e}")
+        return module_name, False, None, f"Error observing {module_name}. Error: {e}"
+
+    version = getattr(mod, '__version__', None)
+    if version is None:
+        try:
+            version = dist_version(module_name)
+        except PackageNotFoundError:
+            version = None
+    return module_name, True, version, None
+
+def report(result):
+    module_name, success, version, err = result
+    with _print_lock:
+        if not success:
+            print(f"FAILURE: {err}")
+            return
+        print(f"SUCCESS: {module_name} imported.")
+        if version is not None:
+            print(f"  Version: {version}")
 
 print(f"Python version: {sys.version}")
 
@@ -30,5 +49,13 @@ packages = [
 ]
 
 print("\nChecking imports:")
-for pkg in packages:
-    check_import(pkg)
+# The imports are independent, so load them concurrently and report in the
+# original order. stderr is process-wide, so it is silenced once around the
+# whole pool rather than per thread.
+with contextlib.redirect_stderr(io.StringIO()):
+    with ThreadPoolExecutor(max_workers=min(8, len(packages))) as pool:
+        futures = [pool.submit(check_import, pkg) for pkg in packages]
+        results = [future.result() for future in futures]
+
+for result in results:
+    report(result)
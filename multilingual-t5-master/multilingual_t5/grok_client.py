@@ -26,21 +26,194 @@ multilingual NLP tasks including:
 """
 
 import os
+import sys
 import json
+import functools
+import contextlib
 import time
+import hashlib
+import importlib.util
+import math
+import random
 import logging
-from typing import Dict, List, Optional, Union, Any, Callable
-from dataclasses import dataclass, field
+import threading
+from typing import Dict, List, Optional, Tuple, Union, Any, Callable
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+except ImportError:  # Optional: only needed for the async batch path
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:  # Optional: falls back to requests over HTTP/1.1
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+# Slotted dataclasses (no per-instance __dict__) where supported (3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# HTTP/2 support in httpx needs the optional h2 package
+_HTTP2_AVAILABLE = httpx is not None and importlib.util.find_spec("h2") is not None
+
+# Transport errors raised by whichever sync HTTP client is in use
+_HTTP_ERRORS = (requests.exceptions.RequestException,)
+if httpx is not None:
+    _HTTP_ERRORS += (httpx.HTTPError,)
+
+# Transport errors raised by whichever async HTTP client is in use
+_ASYNC_HTTP_ERRORS = (asyncio.TimeoutError,)
+if httpx is not None:
+    _ASYNC_HTTP_ERRORS += (httpx.HTTPError,)
+if aiohttp is not None:
+    _ASYNC_HTTP_ERRORS += (aiohttp.ClientError,)
+
+# System prompts. These are kept byte-identical across calls (variable
+# instructions go in the user message) so server-side prompt caching can
+# reuse the shared prefix.
+_SYS_TRANSLATOR = (
+    "You are an expert multilingual translator. Provide accurate, natural "
+    "translations preserving the original meaning, tone, and style."
+)
+_SYS_QA = (
+    "You are a precise question-answering system. Extract the answer from the "
+    "given context. If the answer is not in the context, say 'unanswerable'."
+)
+_SYS_NLI = (
+    "You are an NLI classifier. Given a premise and hypothesis, classify the "
+    "relationship as exactly one of: 'entailment', 'neutral', or "
+    "'contradiction'. Output only the classification label."
+)
+_SYS_NER = (
+    "You are a named entity recognition system. Extract entities of the types "
+    "listed in the request. Format output as 'TYPE: entity $$ TYPE: entity' "
+    "with $$ as separator. If no entities found, output 'NONE'."
+)
+_SYS_PARAPHRASE = (
+    "You are a paraphrase detection system. Determine if two sentences have "
+    "the same meaning. Output exactly 'paraphrase' or 'not_paraphrase'."
+)
+_SYS_NLI_BATCH = (
+    "You are an NLI classifier. Classify the relationship of each premise and "
+    "hypothesis pair as exactly one of: 'entailment', 'neutral', or "
+    "'contradiction'. Output only the requested JSON."
+)
+_SYS_PARAPHRASE_BATCH = (
+    "You are a paraphrase detection system. Determine for each sentence pair "
+    "whether the two sentences have the same meaning, labelling it exactly "
+    "'paraphrase' or 'not_paraphrase'. Output only the requested JSON."
+)
+_SYS_SUMMARIZER = "You are a summarization system. Create a concise, accurate summary."
+_SYS_TRANSLATION_CRITIC = (
+    "You are the world's harshest translation critic. Never give scores "
+    "above 8 unless truly perfect. Find every flaw."
+)
+_SYS_QA_CRITIC = (
+    "You are the world's strictest QA evaluator. Partial matches get low "
+    "scores. Find every flaw."
+)
+_SYS_NER_CRITIC = "You are the world's strictest NER evaluator. Any error is a major flaw."
+
+# Metrics reported by each evaluator, read from "<metric>_score" (0-10)
+_TRANSLATION_METRICS = ("accuracy", "fluency", "completeness", "terminology", "grammar")
+_QA_METRICS = ("correctness", "completeness", "precision", "extractiveness")
+_NER_METRICS = ("precision", "recall", "type_accuracy", "boundary_accuracy")
+
+# How each evaluator's JSON verdict is scored, keyed by method name
+_JUDGES = {
+    "evaluate_translation": {"metric_keys": _TRANSLATION_METRICS, "overall_threshold": 7},
+    # The QA judge reports is_correct itself rather than via a threshold
+    "evaluate_qa_answer": {"metric_keys": _QA_METRICS, "overall_threshold": None},
+    "evaluate_ner": {"metric_keys": _NER_METRICS, "overall_threshold": 8},
+}
+
+# Statuses worth retrying: rate limiting and transient server errors
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Adaptive batch concurrency never drops below this fraction of the caller's
+# max_concurrency, leaving headroom for latency spikes that the moving
+# average lags behind
+_MIN_BATCH_CONCURRENCY_FRACTION = 0.25
+
+def _load_json_response(text: str) -> Any:
+    """Parse the JSON payload of a model response, inside any code fence.
+    
+    The fence bounds are found with str.find and the payload is sliced once
+    and handed straight to the parser, which tolerates the surrounding
+    whitespace, so no intermediate split/strip copies are made.
+    """
+    start = text.find("```")
+    if start < 0:
+        return _json_loads(text)
+    start += 3
+    if text.startswith("json", start):
+        start += 4
+    end = text.find("```", start)
+    return _json_loads(text[start:end if end >= 0 else len(text)])
+
+
+def _error_text(response) -> str:
+    """First 500 characters of an error response body, reading it if streamed."""
+    if httpx is not None and isinstance(response, httpx.Response):
+        response.read()
+    return response.text[:500]
+
+
+def _retry_after(headers) -> float:
+    """Seconds from a Retry-After header, or 0 if absent or not numeric."""
+    try:
+        return float(headers.get("Retry-After", 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _complete_json(text: str) -> Optional[str]:
+    """Return the outermost JSON object in text if it already parses."""
+    start = text.find("{")
+    end = text.rfind("}")
+    if start < 0 or end < start:
+        return None
+    try:
+        _json_loads(text[start:end + 1])
+    except ValueError:
+        return None
+    return text[start:end + 1]
+
+
+def _json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, sort_keys=sort_keys).encode()
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON, using orjson when available.
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    catch the stdlib exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class GrokModel(Enum):
     """Available Grok models."""
@@ -62,7 +235,7 @@ class TaskType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GrokConfig:
     """Configuration for Grok API client."""
     api_key: str = field(default_factory=lambda: os.getenv("GROK_API_KEY", ""))
@@ -75,6 +248,10 @@ class GrokConfig:
     max_retries: int = 3
     retry_delay: float = 1.0
     rate_limit_rpm: int = 60  # Requests per minute
+    pool_maxsize: int = 32  # Pooled keep-alive connections to the API host
+    cache_enabled: bool = True  # Cache responses to low-temperature requests
+    cache_size: int = 1024  # Maximum cached responses (LRU eviction)
+    return_raw_response: bool = False  # Keep the full decoded API response
 
     def __post_init__(self):
         if not self.api_key:
@@ -85,18 +262,18 @@ class GrokConfig:
             )
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class GrokResponse:
     """Response from Grok API."""
     text: str
     model: str
     usage: Dict[str, int]
     finish_reason: str
-    raw_response: Dict[str, Any]
-    latency_ms: float
+    raw_response: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    latency_ms: float = 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EvaluationResult:
     """Result of evaluating model output."""
     score: float
@@ -107,25 +284,112 @@ class EvaluationResult:
 
 
 class RateLimiter:
-    """Simple rate limiter for API calls."""
+    """Token-bucket rate limiter for API calls."""
     
     def __init__(self, requests_per_minute: int = 60):
         self.rpm = requests_per_minute
-        self.requests = []
+        self.capacity = float(requests_per_minute)
+        self.rate = requests_per_minute / 60.0  # Tokens per second
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
     
     def wait_if_needed(self):
-        """Block if rate limit would be exceeded."""
-        now = time.time()
-        # Remove requests older than 1 minute
-        self.requests = [r for r in self.requests if now - r < 60]
+        """Block if rate limit would be exceeded.
         
-        if len(self.requests) >= self.rpm:
-            sleep_time = 60 - (now - self.requests[0]) + 0.1
-            if sleep_time > 0:
-                logger.info(f"Rate limit reached. Sleeping for {sleep_time:.2f}s")
-                time.sleep(sleep_time)
+        Each request start takes one token, whether or not earlier requests
+        have finished; how many run at once is left to the caller (e.g.
+        batch_process's max_concurrency).
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                sleep_time = (1 - self.tokens) / self.rate
+            logger.info(f"Rate limit reached. Sleeping for {sleep_time:.2f}s")
+            # Sleep without the lock so other threads can take refilled tokens
+            time.sleep(sleep_time)
+
+
+class _StreamAccumulator:
+    """Assembles a streamed (server-sent events) chat completion."""
+    
+    def __init__(self, model: str, stop_on_json: bool = False):
+        self.model = model
+        self.stop_on_json = stop_on_json
+        self.parts: List[str] = []
+        self.usage: Dict[str, int] = {}
+        self.finish_reason: Optional[str] = None
+        self.json_text: Optional[str] = None
+    
+    def feed(self, line: Union[str, bytes]) -> bool:
+        """Consume one SSE line; return True once the response is complete."""
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.strip()
+        if not line.startswith("data:"):
+            return False
+        chunk = line[5:].strip()
+        if chunk == "[DONE]":
+            return True
         
-        self.requests.append(time.time())
+        event = _json_loads(chunk)
+        self.model = event.get("model", self.model)
+        self.usage = event.get("usage") or self.usage
+        choice = (event.get("choices") or [{}])[0]
+        delta = (choice.get("delta") or {}).get("content")
+        if delta:
+            self.parts.append(delta)
+            if self.stop_on_json and "}" in delta:
+                # Stop reading as soon as a complete JSON object has arrived
+                self.json_text = _complete_json("".join(self.parts))
+                if self.json_text is not None:
+                    self.finish_reason = "json_complete"
+                    return True
+        self.finish_reason = choice.get("finish_reason") or self.finish_reason
+        return self.finish_reason is not None
+    
+    def result(self) -> Dict[str, Any]:
+        """Return the completion shaped like a non-streamed API response."""
+        text = self.json_text if self.json_text is not None else "".join(self.parts)
+        return {
+            "model": self.model,
+            "usage": self.usage,
+            "choices": [{
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": self.finish_reason or "unknown"
+            }]
+        }
+
+
+class _AsyncResponse:
+    """Common view of an httpx or aiohttp response for _make_request_async."""
+    
+    def __init__(self, response):
+        self._response = response
+        self.headers = response.headers
+        self.status_code = response.status_code if httpx is not None else response.status
+    
+    async def read(self) -> bytes:
+        if httpx is not None:
+            return await self._response.aread()
+        return await self._response.read()
+    
+    async def text(self) -> str:
+        return (await self.read()).decode("utf-8", errors="replace")
+    
+    def lines(self):
+        """Async iterator over the lines of a streamed body."""
+        if httpx is not None:
+            return self._response.aiter_lines()
+        return self._response.content
 
 
 class GrokClient:
@@ -139,17 +403,154 @@ class GrokClient:
         """
         self.config = config or GrokConfig()
         self.rate_limiter = RateLimiter(self.config.rate_limit_rpm)
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Shared by the sync and async sessions
+        self._headers = {
             "Authorization": f"Bearer {self.config.api_key}",
-            "Content-Type": "application/json"
-        })
+            "Content-Type": "application/json",
+            "Connection": "keep-alive"
+        }
+        # Size the pool for batch_process so concurrent workers reuse
+        # keep-alive connections instead of redoing TLS handshakes.
+        self._pool_size = pool = max(self.config.pool_maxsize, self.config.rate_limit_rpm // 10)
+        if httpx is not None:
+            # With HTTP/2, concurrent requests share one multiplexed connection
+            self.session = httpx.Client(
+                http2=_HTTP2_AVAILABLE,
+                timeout=self.config.timeout,
+                limits=httpx.Limits(max_connections=pool, max_keepalive_connections=pool),
+                headers=self._headers
+            )
+        else:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool,
+                pool_maxsize=pool,
+                pool_block=True,
+                max_retries=0
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.session.headers.update(self._headers)
+        self._async_session = None
+        self._cache: "OrderedDict[bytes, GrokResponse]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Smoothed request latency, used to size batch concurrency; None
+        # until the first request has been measured
+        self._ewma_latency_ms: Optional[float] = None
+        self._latency_lock = threading.Lock()
+    
+    def _build_payload(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        # Compare against None so explicit zeros (e.g. temperature=0.0 for
+        # deterministic evaluation) are not replaced by the defaults.
+        config = self.config
+        return {
+            "model": config.model.value,
+            "messages": messages,
+            "max_tokens": config.max_tokens if max_tokens is None else max_tokens,
+            "temperature": config.temperature if temperature is None else temperature,
+            "top_p": config.top_p if top_p is None else top_p,
+            **kwargs
+        }
+    
+    def _parse_response(self, data: Dict[str, Any], latency_ms: float) -> GrokResponse:
+        return GrokResponse(
+            text=data["choices"][0]["message"]["content"],
+            model=data["model"],
+            usage=data.get("usage", {}),
+            finish_reason=data["choices"][0].get("finish_reason", "unknown"),
+            raw_response=data if self.config.return_raw_response else None,
+            latency_ms=latency_ms
+        )
+    
+    def _cache_key(self, payload: Dict[str, Any]) -> Optional[bytes]:
+        """Key for a cacheable (near-deterministic) payload, else None."""
+        if not self.config.cache_enabled or payload["temperature"] > 0.3:
+            return None
+        encoded = _json_dumps(payload, sort_keys=True)
+        return hashlib.blake2b(encoded, digest_size=16).digest()
+    
+    def _cache_get(self, key: Optional[bytes]) -> Optional[GrokResponse]:
+        if key is None:
+            return None
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                return None
+            self._cache.move_to_end(key)
+        return replace(cached, latency_ms=0.0, raw_response=None)
+    
+    def _cache_put(self, key: Optional[bytes], response: GrokResponse):
+        # The key does not include stream or stop_on_json, so only complete
+        # completions are stored: a stop_on_json read cut short at the JSON
+        # would otherwise be served to plain calls with the same payload
+        if key is None or response.finish_reason == "json_complete":
+            return
+        with self._cache_lock:
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.config.cache_size:
+                self._cache.popitem(last=False)
+    
+    def _backoff(self, delay: float) -> float:
+        """Next retry delay using decorrelated jitter, capped at 30s.
+        
+        Randomizing each wait between the base delay and 3x the previous one
+        keeps concurrent workers from retrying in lockstep.
+        """
+        return min(30.0, random.uniform(self.config.retry_delay, delay * 3.0))
+    
+    def _record_latency(self, latency_ms: float):
+        with self._latency_lock:
+            if self._ewma_latency_ms is None:
+                self._ewma_latency_ms = latency_ms
+            else:
+                self._ewma_latency_ms = 0.875 * self._ewma_latency_ms + 0.125 * latency_ms
+    
+    def _concurrency_limit(self, max_concurrency: int) -> int:
+        """Requests to keep in flight to saturate the RPM budget.
+        
+        By Little's law this is roughly RPM * mean latency / 60s, capped by
+        the caller's max_concurrency. Until a latency has been measured the
+        full max_concurrency is used, and the limit is never lowered below
+        _MIN_BATCH_CONCURRENCY_FRACTION of it; the rate limiter still
+        enforces the RPM.
+        """
+        max_concurrency = max(1, max_concurrency)
+        latency_ms = self._ewma_latency_ms
+        if latency_ms is None:
+            return max_concurrency
+        optimal = math.ceil(self.config.rate_limit_rpm * latency_ms / 60000)
+        floor = math.ceil(max_concurrency * _MIN_BATCH_CONCURRENCY_FRACTION)
+        return min(max_concurrency, max(floor, optimal))
+    
+    def _post(self, body: bytes, stream: bool = False):
+        """POST an encoded payload to the chat completions endpoint.
+        
+        Returns a context manager yielding the response; with stream=True
+        the body is left unread so it can be consumed line by line.
+        """
+        url = f"{self.config.base_url}/chat/completions"
+        if httpx is not None:
+            if stream:
+                return self.session.stream("POST", url, content=body)
+            return contextlib.nullcontext(self.session.post(url, content=body))
+        response = self.session.post(url, data=body, stream=stream, timeout=self.config.timeout)
+        return contextlib.closing(response)
     
     def _make_request(
         self,
         messages: List[Dict[str, str]],
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
+        stream: bool = False,
+        stop_on_json: bool = False,
         **kwargs
     ) -> GrokResponse:
         """Make a request to the Grok API with retries.
@@ -158,63 +559,240 @@ class GrokClient:
             messages: List of message dicts with 'role' and 'content'.
             max_tokens: Override default max tokens.
             temperature: Override default temperature.
+            stream: Receive the completion as server-sent events.
+            stop_on_json: When streaming, stop reading once the text contains
+                          a complete JSON object.
             **kwargs: Additional parameters to pass to the API.
             
         Returns:
             GrokResponse object with the API response.
         """
-        self.rate_limiter.wait_if_needed()
+        payload = self._build_payload(messages, max_tokens, temperature, **kwargs)
+        cache_key = self._cache_key(payload)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        if stream:
+            payload = {**payload, "stream": True}
+        body = _json_dumps(payload)
         
-        payload = {
-            "model": self.config.model.value,
-            "messages": messages,
-            "max_tokens": max_tokens or self.config.max_tokens,
-            "temperature": temperature or self.config.temperature,
-            "top_p": self.config.top_p,
-            **kwargs
-        }
+        self.rate_limiter.wait_if_needed()
         
         last_error = None
+        delay = self.config.retry_delay
         for attempt in range(self.config.max_retries):
             try:
-                start_time = time.time()
-                response = self.session.post(
-                    f"{self.config.base_url}/chat/completions",
-                    json=payload,
-                    timeout=self.config.timeout
-                )
-                latency_ms = (time.time() - start_time) * 1000
+                start_time = time.perf_counter()
+                with self._post(body, stream=stream) as response:
+                    status = response.status_code
+                    retry_after = _retry_after(response.headers)
+                    if status >= 400 and status not in _RETRY_STATUSES:
+                        # Client errors (bad request, auth) fail the same way on retry
+                        raise RuntimeError(
+                            f"Request failed with HTTP {status}: {_error_text(response)}"
+                        )
+                    if status not in _RETRY_STATUSES:
+                        if stream:
+                            accumulator = _StreamAccumulator(payload["model"], stop_on_json)
+                            for line in response.iter_lines():
+                                if accumulator.feed(line):
+                                    break
+                            data = accumulator.result()
+                        else:
+                            data = _json_loads(response.content)
+                latency_ms = (time.perf_counter() - start_time) * 1000.0
                 
-                if response.status_code == 429:
-                    # Rate limited, wait and retry
-                    retry_after = int(response.headers.get("Retry-After", 60))
-                    logger.warning(f"Rate limited. Waiting {retry_after}s...")
-                    time.sleep(retry_after)
+                if status in _RETRY_STATUSES:
+                    # Rate limited or transient server error, back off and retry
+                    last_error = f"HTTP {status}"
+                    delay = self._backoff(delay)
+                    wait = max(retry_after, delay)
+                    logger.warning(f"{last_error} (attempt {attempt + 1}). Waiting {wait:.1f}s...")
+                    time.sleep(wait)
                     continue
                 
-                response.raise_for_status()
-                data = response.json()
+                result = self._parse_response(data, latency_ms)
+                self._cache_put(cache_key, result)
+                self._record_latency(latency_ms)
+                return result
                 
-                return GrokResponse(
-                    text=data["choices"][0]["message"]["content"],
-                    model=data["model"],
-                    usage=data.get("usage", {}),
-                    finish_reason=data["choices"][0].get("finish_reason", "unknown"),
-                    raw_response=data,
-                    latency_ms=latency_ms
+            except _HTTP_ERRORS as e:
+                last_error = e
+                logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
+                if attempt < self.config.max_retries - 1:
+                    delay = self._backoff(delay)
+                    time.sleep(delay)
+        
+        raise RuntimeError(f"All retries failed. Last error: {last_error}")
+    
+    def _get_async_session(self):
+        """Return the shared async session, creating it on first use.
+        
+        The async methods need their own session because the sync one
+        (httpx.Client or requests) blocks the event loop. With httpx this
+        is an httpx.AsyncClient, over HTTP/2 when h2 is installed, so
+        batches get the same multiplexed transport as single requests;
+        otherwise it falls back to aiohttp over HTTP/1.1. It is configured
+        like the sync session: same headers and pool size, and the timeout
+        applies per connect/read rather than to the whole (possibly
+        streamed) response. Retries are handled by the same loop in
+        _make_request_async.
+        """
+        if httpx is not None:
+            if self._async_session is None or self._async_session.is_closed:
+                self._async_session = httpx.AsyncClient(
+                    http2=_HTTP2_AVAILABLE,
+                    timeout=self.config.timeout,
+                    limits=httpx.Limits(
+                        max_connections=self._pool_size,
+                        max_keepalive_connections=self._pool_size
+                    ),
+                    headers=self._headers
                 )
+            return self._async_session
+        if aiohttp is None:
+            raise ImportError(
+                "httpx or aiohttp is required for async requests. "
+                "Install it using: pip install httpx"
+            )
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._pool_size),
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=self.config.timeout,
+                    sock_read=self.config.timeout
+                ),
+                headers=self._headers
+            )
+        return self._async_session
+    
+    async def aclose(self):
+        """Close the shared async session, if one was opened."""
+        session, self._async_session = self._async_session, None
+        if session is None:
+            return
+        if httpx is not None:
+            await session.aclose()
+        elif not session.closed:
+            await session.close()
+    
+    @contextlib.asynccontextmanager
+    async def _post_async(self, session, body: bytes):
+        """Async counterpart of _post; the body is left unread so it can be streamed."""
+        url = f"{self.config.base_url}/chat/completions"
+        if httpx is not None:
+            request = session.stream("POST", url, content=body)
+        else:
+            request = session.post(url, data=body)
+        async with request as response:
+            yield _AsyncResponse(response)
+    
+    async def _make_request_async(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        stream: bool = False,
+        stop_on_json: bool = False,
+        **kwargs
+    ) -> GrokResponse:
+        """Async variant of _make_request using the shared async session.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content'.
+            max_tokens: Override default max tokens.
+            temperature: Override default temperature.
+            stream: Receive the completion as server-sent events.
+            stop_on_json: When streaming, stop reading once the text contains
+                          a complete JSON object.
+            **kwargs: Additional parameters to pass to the API.
+            
+        Returns:
+            GrokResponse object with the API response.
+        """
+        payload = self._build_payload(messages, max_tokens, temperature, **kwargs)
+        cache_key = self._cache_key(payload)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        if stream:
+            payload = {**payload, "stream": True}
+        body = _json_dumps(payload)
+        
+        session = self._get_async_session()
+        await asyncio.to_thread(self.rate_limiter.wait_if_needed)
+        
+        last_error = None
+        delay = self.config.retry_delay
+        for attempt in range(self.config.max_retries):
+            try:
+                start_time = time.perf_counter()
+                async with self._post_async(session, body) as response:
+                    status = response.status_code
+                    retry_after = _retry_after(response.headers)
+                    if status >= 400 and status not in _RETRY_STATUSES:
+                        raise RuntimeError(
+                            f"Request failed with HTTP {status}: {(await response.text())[:500]}"
+                        )
+                    if status not in _RETRY_STATUSES:
+                        if stream:
+                            accumulator = _StreamAccumulator(payload["model"], stop_on_json)
+                            async for line in response.lines():
+                                if accumulator.feed(line):
+                                    break
+                            data = accumulator.result()
+                        else:
+                            data = _json_loads(await response.read())
+                latency_ms = (time.perf_counter() - start_time) * 1000.0
+                
+                if status in _RETRY_STATUSES:
+                    last_error = f"HTTP {status}"
+                    delay = self._backoff(delay)
+                    wait = max(retry_after, delay)
+                    logger.warning(f"{last_error} (attempt {attempt + 1}). Waiting {wait:.1f}s...")
+                    await asyncio.sleep(wait)
+                    continue
+                
+                result = self._parse_response(data, latency_ms)
+                self._cache_put(cache_key, result)
+                self._record_latency(latency_ms)
+                return result
                 
-            except requests.exceptions.RequestException as e:
+            except _ASYNC_HTTP_ERRORS as e:
                 last_error = e
                 logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
                 if attempt < self.config.max_retries - 1:
-                    time.sleep(self.config.retry_delay * (attempt + 1))
+                    delay = self._backoff(delay)
+                    await asyncio.sleep(delay)
         
         raise RuntimeError(f"All retries failed. Last error: {last_error}")
     
     # =========================================================================
     # Core NLP Task Methods (mT5-style)
     # =========================================================================
+    #
+    # Each task is split into a ``_<task>_request`` builder that returns the
+    # messages and request parameters, a sync method and an ``_async``
+    # variant, so the prompts are defined once for both transports.
+    
+    def _translate_request(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+        prompt = f"Translate from {source_lang} to {target_lang}:\n\n{text}"
+        if context:
+            prompt = f"Context: {context}\n\n{prompt}"
+        
+        messages = [
+            {"role": "system", "content": _SYS_TRANSLATOR},
+            {"role": "user", "content": prompt}
+        ]
+        
+        return messages, {"temperature": 0.3}
     
     def translate(
         self,
@@ -234,16 +812,34 @@ class GrokClient:
         Returns:
             GrokResponse with translated text.
         """
-        prompt = f"Translate from {source_lang} to {target_lang}:\n\n{text}"
-        if context:
-            prompt = f"Context: {context}\n\n{prompt}"
+        messages, params = self._translate_request(text, source_lang, target_lang, context)
+        return self._make_request(messages, **params)
+    
+    async def translate_async(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        context: Optional[str] = None
+    ) -> GrokResponse:
+        """Async variant of translate."""
+        messages, params = self._translate_request(text, source_lang, target_lang, context)
+        return await self._make_request_async(messages, **params)
+    
+    def _question_answering_request(
+        self,
+        question: str,
+        context: str,
+        language: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+        lang_instruction = f" Answer in {language}." if language else ""
         
         messages = [
-            {"role": "system", "content": "You are an expert multilingual translator. Provide accurate, natural translations preserving the original meaning, tone, and style."},
-            {"role": "user", "content": prompt}
+            {"role": "system", "content": _SYS_QA},
+            {"role": "user", "content": f"Context:\n{context}\n\nQuestion: {question}{lang_instruction}\n\nAnswer:"}
         ]
         
-        return self._make_request(messages, temperature=0.3)
+        return messages, {"temperature": 0.1}
     
     def question_answering(
         self,
@@ -261,14 +857,31 @@ class GrokClient:
         Returns:
             GrokResponse with the answer.
         """
-        lang_instruction = f" Answer in {language}." if language else ""
-        
+        messages, params = self._question_answering_request(question, context, language)
+        return self._make_request(messages, **params)
+    
+    async def question_answering_async(
+        self,
+        question: str,
+        context: str,
+        language: Optional[str] = None
+    ) -> GrokResponse:
+        """Async variant of question_answering."""
+        messages, params = self._question_answering_request(question, context, language)
+        return await self._make_request_async(messages, **params)
+    
+    def _natural_language_inference_request(
+        self,
+        premise: str,
+        hypothesis: str,
+        language: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
         messages = [
-            {"role": "system", "content": f"You are a precise question-answering system. Extract the answer from the given context. If the answer is not in the context, say 'unanswerable'.{lang_instruction}"},
-            {"role": "user", "content": f"Context:\n{context}\n\nQuestion: {question}\n\nAnswer:"}
+            {"role": "system", "content": _SYS_NLI},
+            {"role": "user", "content": f"Premise: {premise}\n\nHypothesis: {hypothesis}\n\nClassification:"}
         ]
         
-        return self._make_request(messages, temperature=0.1)
+        return messages, {"temperature": 0.1, "max_tokens": 20}
     
     def natural_language_inference(
         self,
@@ -286,12 +899,98 @@ class GrokClient:
         Returns:
             GrokResponse with classification (entailment/neutral/contradiction).
         """
+        messages, params = self._natural_language_inference_request(premise, hypothesis, language)
+        return self._make_request(messages, **params)
+    
+    async def natural_language_inference_async(
+        self,
+        premise: str,
+        hypothesis: str,
+        language: Optional[str] = None
+    ) -> GrokResponse:
+        """Async variant of natural_language_inference."""
+        messages, params = self._natural_language_inference_request(premise, hypothesis, language)
+        return await self._make_request_async(messages, **params)
+    
+    def _classify_group(
+        self,
+        prompt: str,
+        system_prompt: str,
+        count: int
+    ) -> Optional[List[str]]:
+        """Request {"labels": [...]} for count items in one call; None if invalid."""
+        response = self.generate(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=0.1,
+            max_tokens=10 * count + 20,
+            response_format={"type": "json_object"}
+        )
+        
+        try:
+            data = _load_json_response(response.text)
+        except json.JSONDecodeError:
+            return None
+        labels = data.get("labels") if isinstance(data, dict) else data
+        if not isinstance(labels, list) or len(labels) != count:
+            return None
+        if not all(isinstance(label, str) for label in labels):
+            return None
+        return labels
+    
+    def batch_natural_language_inference(
+        self,
+        pairs: List[Tuple[str, str]],
+        language: Optional[str] = None
+    ) -> List[str]:
+        """Classify several premise/hypothesis pairs in one request.
+        
+        If the response is not a JSON list with one label per pair, the
+        pairs are classified one by one instead.
+        
+        Args:
+            pairs: List of (premise, hypothesis) tuples.
+            language: Optional language code.
+            
+        Returns:
+            One label (entailment/neutral/contradiction) per pair, in order.
+        """
+        listing = "\n".join(
+            f"{n}. Premise: {premise}\n   Hypothesis: {hypothesis}"
+            for n, (premise, hypothesis) in enumerate(pairs, 1)
+        )
+        prompt = (
+            f"Classify each of these {len(pairs)} premise/hypothesis pairs.\n\n"
+            f"{listing}\n\n"
+            'Respond in JSON: {"labels": ["entailment" | "neutral" | "contradiction", ...]} '
+            "with exactly one label per pair, in the same order."
+        )
+        
+        labels = self._classify_group(prompt, _SYS_NLI_BATCH, len(pairs))
+        if labels is None:
+            logger.warning(
+                f"Batched NLI of {len(pairs)} pairs failed; falling back to per-item calls"
+            )
+            labels = [
+                self.natural_language_inference(premise, hypothesis, language).text
+                for premise, hypothesis in pairs
+            ]
+        return labels
+    
+    def _named_entity_recognition_request(
+        self,
+        text: str,
+        entity_types: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+        types = entity_types or ["PER", "LOC", "ORG"]
+        types_str = ", ".join(types)
+        
         messages = [
-            {"role": "system", "content": "You are an NLI classifier. Given a premise and hypothesis, classify the relationship as exactly one of: 'entailment', 'neutral', or 'contradiction'. Output only the classification label."},
-            {"role": "user", "content": f"Premise: {premise}\n\nHypothesis: {hypothesis}\n\nClassification:"}
+            {"role": "system", "content": _SYS_NER},
+            {"role": "user", "content": f"Entity types: {types_str}\n\ntag: {text}"}
         ]
         
-        return self._make_request(messages, temperature=0.1, max_tokens=20)
+        return messages, {"temperature": 0.1}
     
     def named_entity_recognition(
         self,
@@ -308,15 +1007,30 @@ class GrokClient:
         Returns:
             GrokResponse with extracted entities in "TYPE: entity" format.
         """
-        types = entity_types or ["PER", "LOC", "ORG"]
-        types_str = ", ".join(types)
-        
+        messages, params = self._named_entity_recognition_request(text, entity_types)
+        return self._make_request(messages, **params)
+    
+    async def named_entity_recognition_async(
+        self,
+        text: str,
+        entity_types: Optional[List[str]] = None
+    ) -> GrokResponse:
+        """Async variant of named_entity_recognition."""
+        messages, params = self._named_entity_recognition_request(text, entity_types)
+        return await self._make_request_async(messages, **params)
+    
+    def _paraphrase_detection_request(
+        self,
+        sentence1: str,
+        sentence2: str,
+        language: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
         messages = [
-            {"role": "system", "content": f"You are a named entity recognition system. Extract entities of types: {types_str}. Format output as 'TYPE: entity $$ TYPE: entity' with $$ as separator. If no entities found, output 'NONE'."},
-            {"role": "user", "content": f"tag: {text}"}
+            {"role": "system", "content": _SYS_PARAPHRASE},
+            {"role": "user", "content": f"Sentence 1: {sentence1}\n\nSentence 2: {sentence2}\n\nAre these paraphrases?"}
         ]
         
-        return self._make_request(messages, temperature=0.1)
+        return messages, {"temperature": 0.1, "max_tokens": 20}
     
     def paraphrase_detection(
         self,
@@ -334,12 +1048,74 @@ class GrokClient:
         Returns:
             GrokResponse with 'paraphrase' or 'not_paraphrase'.
         """
+        messages, params = self._paraphrase_detection_request(sentence1, sentence2, language)
+        return self._make_request(messages, **params)
+    
+    async def paraphrase_detection_async(
+        self,
+        sentence1: str,
+        sentence2: str,
+        language: Optional[str] = None
+    ) -> GrokResponse:
+        """Async variant of paraphrase_detection."""
+        messages, params = self._paraphrase_detection_request(sentence1, sentence2, language)
+        return await self._make_request_async(messages, **params)
+    
+    def batch_paraphrase_detection(
+        self,
+        pairs: List[Tuple[str, str]],
+        language: Optional[str] = None
+    ) -> List[str]:
+        """Judge several sentence pairs for paraphrase in one request.
+        
+        If the response is not a JSON list with one label per pair, the
+        pairs are judged one by one instead.
+        
+        Args:
+            pairs: List of (sentence1, sentence2) tuples.
+            language: Optional language code.
+            
+        Returns:
+            One label ('paraphrase' or 'not_paraphrase') per pair, in order.
+        """
+        listing = "\n".join(
+            f"{n}. Sentence 1: {sentence1}\n   Sentence 2: {sentence2}"
+            for n, (sentence1, sentence2) in enumerate(pairs, 1)
+        )
+        prompt = (
+            f"Are the sentences in each of these {len(pairs)} pairs paraphrases?\n\n"
+            f"{listing}\n\n"
+            'Respond in JSON: {"labels": ["paraphrase" | "not_paraphrase", ...]} '
+            "with exactly one label per pair, in the same order."
+        )
+        
+        labels = self._classify_group(prompt, _SYS_PARAPHRASE_BATCH, len(pairs))
+        if labels is None:
+            logger.warning(
+                f"Batched paraphrase detection of {len(pairs)} pairs failed; "
+                "falling back to per-item calls"
+            )
+            labels = [
+                self.paraphrase_detection(sentence1, sentence2, language).text
+                for sentence1, sentence2 in pairs
+            ]
+        return labels
+    
+    def _summarize_request(
+        self,
+        text: str,
+        max_length: Optional[int] = None,
+        language: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+        length_instruction = f" Maximum {max_length} words." if max_length else ""
+        lang_instruction = f" Write in {language}." if language else ""
+        
         messages = [
-            {"role": "system", "content": "You are a paraphrase detection system. Determine if two sentences have the same meaning. Output exactly 'paraphrase' or 'not_paraphrase'."},
-            {"role": "user", "content": f"Sentence 1: {sentence1}\n\nSentence 2: {sentence2}\n\nAre these paraphrases?"}
+            {"role": "system", "content": _SYS_SUMMARIZER},
+            {"role": "user", "content": f"Summarize:{length_instruction}{lang_instruction}\n\n{text}"}
         ]
         
-        return self._make_request(messages, temperature=0.1, max_tokens=20)
+        return messages, {"temperature": 0.5}
     
     def summarize(
         self,
@@ -357,15 +1133,31 @@ class GrokClient:
         Returns:
             GrokResponse with summary.
         """
-        length_instruction = f" Maximum {max_length} words." if max_length else ""
-        lang_instruction = f" Write in {language}." if language else ""
-        
-        messages = [
-            {"role": "system", "content": f"You are a summarization system. Create a concise, accurate summary.{length_instruction}{lang_instruction}"},
-            {"role": "user", "content": f"Summarize:\n\n{text}"}
-        ]
+        messages, params = self._summarize_request(text, max_length, language)
+        return self._make_request(messages, **params)
+    
+    async def summarize_async(
+        self,
+        text: str,
+        max_length: Optional[int] = None,
+        language: Optional[str] = None
+    ) -> GrokResponse:
+        """Async variant of summarize."""
+        messages, params = self._summarize_request(text, max_length, language)
+        return await self._make_request_async(messages, **params)
+    
+    def _generate_request(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
         
-        return self._make_request(messages, temperature=0.5)
+        return messages, kwargs
     
     def generate(
         self,
@@ -383,24 +1175,68 @@ class GrokClient:
         Returns:
             GrokResponse with generated text.
         """
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-        
-        return self._make_request(messages, **kwargs)
+        messages, params = self._generate_request(prompt, system_prompt, **kwargs)
+        return self._make_request(messages, **params)
+    
+    async def generate_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs
+    ) -> GrokResponse:
+        """Async variant of generate."""
+        messages, params = self._generate_request(prompt, system_prompt, **kwargs)
+        return await self._make_request_async(messages, **params)
     
     # =========================================================================
     # Evaluation Methods (Harsh & Strict Evaluator)
     # =========================================================================
     
-    def evaluate_translation(
+    def _evaluate_translation_request(
         self,
         source_text: str,
         translation: str,
         reference: Optional[str] = None,
         source_lang: str = "en",
         target_lang: str = "es"
+    ) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
+        ref_context = f"\nReference translation: {reference}" if reference else ""
+        
+        prompt = f"""Evaluate this translation with EXTREME strictness. Be harsh and critical.
+
+Source ({source_lang}): {source_text}
+Translation ({target_lang}): {translation}{ref_context}
+
+Score on these criteria (0-10, 10 is perfect, be strict):
+1. ACCURACY: Is the meaning preserved exactly? Any mistranslation = heavy penalty
+2. FLUENCY: Does it sound natural in the target language?
+3. COMPLETENESS: Is anything missing or added?
+4. TERMINOLOGY: Are technical terms correct?
+5. GRAMMAR: Any grammatical errors?
+
+Respond in JSON format:
+{{
+    "accuracy_score": <0-10>,
+    "fluency_score": <0-10>,
+    "completeness_score": <0-10>,
+    "terminology_score": <0-10>,
+    "grammar_score": <0-10>,
+    "overall_score": <0-10>,
+    "errors": ["list of specific errors"],
+    "suggestions": ["improvements"],
+    "harsh_feedback": "brutal honest assessment"
+}}"""
+        
+        return self._generate_request(prompt, _SYS_TRANSLATION_CRITIC, temperature=0.2)
+    
+    def evaluate_translation(
+        self,
+        source_text: str,
+        translation: str,
+        reference: Optional[str] = None,
+        source_lang: str = "en",
+        target_lang: str = "es",
+        stream: bool = False
     ) -> EvaluationResult:
         """Strictly evaluate a translation.
         
@@ -410,25 +1246,77 @@ class GrokClient:
             reference: Optional reference translation for comparison.
             source_lang: Source language code.
             target_lang: Target language code.
+            stream: Stream the response and stop once the JSON is complete.
             
         Returns:
             EvaluationResult with detailed scoring.
         """
-        ref_context = f"\nReference translation: {reference}" if reference else ""
+        messages, params = self._evaluate_translation_request(
+            source_text, translation, reference, source_lang, target_lang
+        )
+        return self._evaluate_json(
+            messages, params, stream=stream, **_JUDGES["evaluate_translation"]
+        )
+    
+    def batch_evaluate_translations(
+        self,
+        items: List[Dict[str, Any]],
+        chunk: int = 8
+    ) -> List[EvaluationResult]:
+        """Strictly evaluate translations, several per API call.
         
-        prompt = f"""Evaluate this translation with EXTREME strictness. Be harsh and critical.
+        Packs up to `chunk` translations into one prompt so the instructions
+        and per-request overhead are shared. A chunk whose response is not a
+        JSON array of the right length is re-evaluated item by item.
+        
+        Args:
+            items: List of evaluate_translation keyword dicts.
+            chunk: Number of translations per request.
+            
+        Returns:
+            List of EvaluationResult, in the same order as items.
+        """
+        results = []
+        for start in range(0, len(items), chunk):
+            group = items[start:start + chunk]
+            evaluations = self._evaluate_translation_group(group)
+            if evaluations is None:
+                logger.warning(
+                    f"Batched evaluation of {len(group)} translations failed; "
+                    "falling back to per-item calls"
+                )
+                evaluations = [self.evaluate_translation(**item) for item in group]
+            results.extend(evaluations)
+        return results
+    
+    def _evaluate_translation_group(
+        self,
+        group: List[Dict[str, Any]]
+    ) -> Optional[List[EvaluationResult]]:
+        """Evaluate a group of translations in one call; None if invalid."""
+        entries = [
+            {
+                "source": item["source_text"],
+                "translation": item["translation"],
+                "reference": item.get("reference"),
+                "src": item.get("source_lang", "en"),
+                "tgt": item.get("target_lang", "es"),
+            }
+            for item in group
+        ]
+        
+        prompt = f"""Evaluate each of these {len(group)} translations with EXTREME strictness. Be harsh and critical.
 
-Source ({source_lang}): {source_text}
-Translation ({target_lang}): {translation}{ref_context}
+{_json_dumps(entries).decode()}
 
-Score on these criteria (0-10, 10 is perfect, be strict):
+Score each on these criteria (0-10, 10 is perfect, be strict):
 1. ACCURACY: Is the meaning preserved exactly? Any mistranslation = heavy penalty
 2. FLUENCY: Does it sound natural in the target language?
 3. COMPLETENESS: Is anything missing or added?
 4. TERMINOLOGY: Are technical terms correct?
 5. GRAMMAR: Any grammatical errors?
 
-Respond in JSON format:
+Respond with a JSON array of exactly {len(group)} objects, in the same order as the input, each in this format:
 {{
     "accuracy_score": <0-10>,
     "fluency_score": <0-10>,
@@ -443,61 +1331,31 @@ Respond in JSON format:
         
         response = self.generate(
             prompt,
-            system_prompt="You are the world's harshest translation critic. Never give scores above 8 unless truly perfect. Find every flaw.",
-            temperature=0.2
+            system_prompt=_SYS_TRANSLATION_CRITIC,
+            temperature=0.2,
+            max_tokens=400 * len(group)
         )
         
         try:
-            # Parse JSON from response
-            json_str = response.text
-            if "```json" in json_str:
-                json_str = json_str.split("```json")[1].split("```")[0]
-            elif "```" in json_str:
-                json_str = json_str.split("```")[1].split("```")[0]
-            
-            data = json.loads(json_str.strip())
-            
-            return EvaluationResult(
-                score=data.get("overall_score", 0) / 10.0,
-                metrics={
-                    "accuracy": data.get("accuracy_score", 0) / 10.0,
-                    "fluency": data.get("fluency_score", 0) / 10.0,
-                    "completeness": data.get("completeness_score", 0) / 10.0,
-                    "terminology": data.get("terminology_score", 0) / 10.0,
-                    "grammar": data.get("grammar_score", 0) / 10.0,
-                },
-                feedback=data.get("harsh_feedback", ""),
-                is_correct=data.get("overall_score", 0) >= 7,
-                details=data
-            )
+            data = _load_json_response(response.text)
         except json.JSONDecodeError:
-            # Return a basic evaluation if JSON parsing fails
-            return EvaluationResult(
-                score=0.5,
-                metrics={},
-                feedback=response.text,
-                is_correct=False,
-                details={"raw_response": response.text}
-            )
+            return None
+        if not isinstance(data, list) or len(data) != len(group):
+            return None
+        if not all(isinstance(entry, dict) for entry in data):
+            return None
+        return [
+            self._evaluation_result(entry, **_JUDGES["evaluate_translation"])
+            for entry in data
+        ]
     
-    def evaluate_qa_answer(
+    def _evaluate_qa_answer_request(
         self,
         question: str,
         context: str,
         predicted_answer: str,
         gold_answer: Optional[str] = None
-    ) -> EvaluationResult:
-        """Strictly evaluate a QA answer.
-        
-        Args:
-            question: The question asked.
-            context: The context/passage.
-            predicted_answer: The predicted answer to evaluate.
-            gold_answer: Optional gold/reference answer.
-            
-        Returns:
-            EvaluationResult with detailed scoring.
-        """
+    ) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
         gold_context = f"\nGold answer: {gold_answer}" if gold_answer else ""
         
         prompt = f"""Evaluate this QA answer with EXTREME strictness.
@@ -526,58 +1384,41 @@ Respond in JSON:
     "harsh_feedback": "brutal assessment"
 }}"""
         
-        response = self.generate(
-            prompt,
-            system_prompt="You are the world's strictest QA evaluator. Partial matches get low scores. Find every flaw.",
-            temperature=0.2
-        )
-        
-        try:
-            json_str = response.text
-            if "```json" in json_str:
-                json_str = json_str.split("```json")[1].split("```")[0]
-            elif "```" in json_str:
-                json_str = json_str.split("```")[1].split("```")[0]
-            
-            data = json.loads(json_str.strip())
-            
-            return EvaluationResult(
-                score=data.get("overall_score", 0) / 10.0,
-                metrics={
-                    "correctness": data.get("correctness_score", 0) / 10.0,
-                    "completeness": data.get("completeness_score", 0) / 10.0,
-                    "precision": data.get("precision_score", 0) / 10.0,
-                    "extractiveness": data.get("extractiveness_score", 0) / 10.0,
-                },
-                feedback=data.get("harsh_feedback", ""),
-                is_correct=data.get("is_correct", False),
-                details=data
-            )
-        except json.JSONDecodeError:
-            return EvaluationResult(
-                score=0.5,
-                metrics={},
-                feedback=response.text,
-                is_correct=False,
-                details={"raw_response": response.text}
-            )
+        return self._generate_request(prompt, _SYS_QA_CRITIC, temperature=0.2)
     
-    def evaluate_ner(
+    def evaluate_qa_answer(
         self,
-        text: str,
-        predicted_entities: str,
-        gold_entities: Optional[str] = None
+        question: str,
+        context: str,
+        predicted_answer: str,
+        gold_answer: Optional[str] = None,
+        stream: bool = False
     ) -> EvaluationResult:
-        """Strictly evaluate NER output.
+        """Strictly evaluate a QA answer.
         
         Args:
-            text: Original text.
-            predicted_entities: Predicted entities in "TYPE: entity $$ ..." format.
-            gold_entities: Optional gold entities for comparison.
+            question: The question asked.
+            context: The context/passage.
+            predicted_answer: The predicted answer to evaluate.
+            gold_answer: Optional gold/reference answer.
+            stream: Stream the response and stop once the JSON is complete.
             
         Returns:
             EvaluationResult with detailed scoring.
         """
+        messages, params = self._evaluate_qa_answer_request(
+            question, context, predicted_answer, gold_answer
+        )
+        return self._evaluate_json(
+            messages, params, stream=stream, **_JUDGES["evaluate_qa_answer"]
+        )
+    
+    def _evaluate_ner_request(
+        self,
+        text: str,
+        predicted_entities: str,
+        gold_entities: Optional[str] = None
+    ) -> Tuple[List[Dict[str, str]], Dict[str, Any]]:
         gold_context = f"\nGold entities: {gold_entities}" if gold_entities else ""
         
         prompt = f"""Evaluate this NER extraction with EXTREME strictness.
@@ -605,46 +1446,279 @@ Respond in JSON:
     "harsh_feedback": "brutal assessment"
 }}"""
         
-        response = self.generate(
-            prompt,
-            system_prompt="You are the world's strictest NER evaluator. Any error is a major flaw.",
-            temperature=0.2
+        return self._generate_request(prompt, _SYS_NER_CRITIC, temperature=0.2)
+    
+    def evaluate_ner(
+        self,
+        text: str,
+        predicted_entities: str,
+        gold_entities: Optional[str] = None,
+        stream: bool = False
+    ) -> EvaluationResult:
+        """Strictly evaluate NER output.
+        
+        Args:
+            text: Original text.
+            predicted_entities: Predicted entities in "TYPE: entity $$ ..." format.
+            gold_entities: Optional gold entities for comparison.
+            stream: Stream the response and stop once the JSON is complete.
+            
+        Returns:
+            EvaluationResult with detailed scoring.
+        """
+        messages, params = self._evaluate_ner_request(text, predicted_entities, gold_entities)
+        return self._evaluate_json(
+            messages, params, stream=stream, **_JUDGES["evaluate_ner"]
         )
+    
+    def _evaluation_result(
+        self,
+        data: Dict[str, Any],
+        metric_keys: Tuple[str, ...],
+        overall_threshold: Optional[int] = 7,
+        feedback_key: str = "harsh_feedback"
+    ) -> EvaluationResult:
+        """Build an EvaluationResult from a judge's 0-10 JSON scores.
+        
+        Each metric key k is read from "<k>_score". With overall_threshold
+        None, correctness comes from the judge's own "is_correct" field.
+        """
+        overall = data.get("overall_score", 0)
+        if overall_threshold is None:
+            is_correct = data.get("is_correct", False)
+        else:
+            is_correct = overall >= overall_threshold
         
+        return EvaluationResult(
+            score=overall / 10.0,
+            metrics={k: data.get(f"{k}_score", 0) / 10.0 for k in metric_keys},
+            feedback=data.get(feedback_key, ""),
+            is_correct=is_correct,
+            details=data
+        )
+    
+    def _parse_evaluation(
+        self,
+        text: str,
+        metric_keys: Tuple[str, ...],
+        overall_threshold: Optional[int] = 7,
+        feedback_key: str = "harsh_feedback"
+    ) -> EvaluationResult:
+        """Parse a judge's JSON verdict into an EvaluationResult."""
         try:
-            json_str = response.text
-            if "```json" in json_str:
-                json_str = json_str.split("```json")[1].split("```")[0]
-            elif "```" in json_str:
-                json_str = json_str.split("```")[1].split("```")[0]
-            
-            data = json.loads(json_str.strip())
-            
-            return EvaluationResult(
-                score=data.get("overall_score", 0) / 10.0,
-                metrics={
-                    "precision": data.get("precision_score", 0) / 10.0,
-                    "recall": data.get("recall_score", 0) / 10.0,
-                    "type_accuracy": data.get("type_accuracy_score", 0) / 10.0,
-                    "boundary_accuracy": data.get("boundary_accuracy_score", 0) / 10.0,
-                },
-                feedback=data.get("harsh_feedback", ""),
-                is_correct=data.get("overall_score", 0) >= 8,
-                details=data
-            )
+            data = _load_json_response(text)
         except json.JSONDecodeError:
+            # Return a basic evaluation if JSON parsing fails
             return EvaluationResult(
                 score=0.5,
                 metrics={},
-                feedback=response.text,
+                feedback=text,
                 is_correct=False,
-                details={"raw_response": response.text}
+                details={"raw_response": text}
             )
+        
+        return self._evaluation_result(data, metric_keys, overall_threshold, feedback_key)
+    
+    def _evaluate_json(
+        self,
+        messages: List[Dict[str, str]],
+        params: Dict[str, Any],
+        *,
+        metric_keys: Tuple[str, ...],
+        overall_threshold: Optional[int] = 7,
+        feedback_key: str = "harsh_feedback",
+        stream: bool = False
+    ) -> EvaluationResult:
+        """Run a JSON-scoring judge request and parse it into an EvaluationResult."""
+        response = self._make_request(messages, stream=stream, stop_on_json=stream, **params)
+        return self._parse_evaluation(response.text, metric_keys, overall_threshold, feedback_key)
+    
+    # =========================================================================
+    # Batch API (Offline) Methods
+    # =========================================================================
+    
+    def _batch_api(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Call a Files/Batches endpoint.
+        
+        These calls are rare and some are multipart uploads, so they go
+        through a one-off request rather than the pooled JSON session.
+        """
+        response = requests.request(
+            method,
+            f"{self.config.base_url}{path}",
+            headers={"Authorization": f"Bearer {self.config.api_key}"},
+            timeout=self.config.timeout,
+            **kwargs
+        )
+        response.raise_for_status()
+        return response
+    
+    def batch_request(self, custom_id: str, task_fn: Callable, **kwargs) -> Dict[str, Any]:
+        """Build a Batch API request line for task_fn(**kwargs) without sending it.
+        
+        Args:
+            custom_id: Identifier used to match the result to its input.
+            task_fn: A task or evaluation method of this client
+                     (e.g., self.natural_language_inference).
+            **kwargs: Arguments task_fn would be called with.
+            
+        Returns:
+            Request dict for create_batch.
+        """
+        messages, params = getattr(self, f"_{task_fn.__name__}_request")(**kwargs)
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": self._build_payload(messages, **params)
+        }
+    
+    def create_batch(
+        self,
+        batch_requests: List[Dict[str, Any]],
+        completion_window: str = "24h"
+    ) -> str:
+        """Upload request lines as a JSONL file and start a batch job.
+        
+        Batch jobs are billed at a discount and do not count against the
+        live rate limit, at the cost of completing asynchronously.
+        
+        Args:
+            batch_requests: Request dicts from batch_request.
+            completion_window: Time the API has to complete the job.
+            
+        Returns:
+            The batch ID.
+        """
+        jsonl = b"\n".join(_json_dumps(request) for request in batch_requests)
+        upload = self._batch_api(
+            "POST", "/files",
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", jsonl, "application/jsonl")}
+        ).json()
+        batch = self._batch_api(
+            "POST", "/batches",
+            json={
+                "input_file_id": upload["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": completion_window
+            }
+        ).json()
+        return batch["id"]
+    
+    def get_batch(self, batch_id: str) -> Dict[str, Any]:
+        """Fetch the status of a batch job."""
+        return self._batch_api("GET", f"/batches/{batch_id}").json()
+    
+    def get_batch_results(self, batch: Dict[str, Any]) -> Dict[str, GrokResponse]:
+        """Download the successful responses of a finished batch job.
+        
+        Args:
+            batch: Batch status dict from get_batch.
+            
+        Returns:
+            Dict mapping custom_id to GrokResponse. Requests that failed are
+            absent.
+        """
+        results = {}
+        output_file_id = batch.get("output_file_id")
+        if not output_file_id:
+            return results
+        content = self._batch_api("GET", f"/files/{output_file_id}/content").content
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            entry = _json_loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                results[entry["custom_id"]] = self._parse_response(response["body"], 0.0)
+        return results
+    
+    def batch_result(
+        self,
+        task_fn: Callable,
+        response: GrokResponse
+    ) -> Union[GrokResponse, EvaluationResult]:
+        """Interpret a batch response as task_fn would have returned it.
+        
+        Evaluation methods get their JSON verdict parsed into an
+        EvaluationResult; other tasks return the response unchanged.
+        """
+        judge = _JUDGES.get(task_fn.__name__)
+        if judge is None:
+            return response
+        return self._parse_evaluation(response.text, **judge)
     
     # =========================================================================
     # Batch Processing Methods
     # =========================================================================
     
+    def _resolve_async_task(self, task_fn: Callable) -> Callable:
+        """Map a bound task method (e.g. self.translate) to its async variant."""
+        if (httpx is None and aiohttp is None) or getattr(task_fn, "__self__", None) is not self:
+            return task_fn
+        return getattr(self, f"{task_fn.__name__}_async", task_fn)
+    
+    async def batch_process_async(
+        self,
+        items: List[Dict[str, Any]],
+        task_fn: Callable,
+        max_concurrency: int = 5
+    ) -> List[Optional[GrokResponse]]:
+        """Process multiple items concurrently on the event loop.
+        
+        Results are collected as they complete, so a slow item does not hold
+        up the others. Sync task functions without an async variant run in
+        worker threads.
+        
+        Args:
+            items: List of dicts with parameters for each task.
+            task_fn: The task function to call (e.g., self.translate or
+                     self.translate_async).
+            max_concurrency: Maximum requests in flight at once. The actual
+                             limit adapts to observed latency and is
+                             re-evaluated every 32 completions.
+            
+        Returns:
+            List of GrokResponse objects (None for failed items), in the
+            same order as items.
+        """
+        task_fn = self._resolve_async_task(task_fn)
+        is_async = asyncio.iscoroutinefunction(task_fn)
+        results: List[Optional[GrokResponse]] = [None] * len(items)
+        limit = self._concurrency_limit(max_concurrency)
+        in_flight = 0
+        slots = asyncio.Condition()
+        
+        async def run(index: int, item: Dict[str, Any]):
+            nonlocal in_flight
+            async with slots:
+                await slots.wait_for(lambda: in_flight < limit)
+                in_flight += 1
+            try:
+                if is_async:
+                    return index, await task_fn(**item)
+                return index, await asyncio.to_thread(task_fn, **item)
+            except Exception as e:
+                logger.error(f"Batch item failed: {e}")
+                return index, None
+            finally:
+                async with slots:
+                    in_flight -= 1
+                    slots.notify_all()
+        
+        completed = 0
+        for next_done in asyncio.as_completed([run(i, item) for i, item in enumerate(items)]):
+            index, result = await next_done
+            results[index] = result
+            completed += 1
+            if completed % 32 == 0:
+                async with slots:
+                    limit = self._concurrency_limit(max_concurrency)
+                    slots.notify_all()
+        
+        return results
+    
     def batch_process(
         self,
         items: List[Dict[str, Any]],
@@ -653,6 +1727,8 @@ Respond in JSON:
     ) -> List[GrokResponse]:
         """Process multiple items in parallel.
         
+        Sync wrapper around batch_process_async.
+        
         Args:
             items: List of dicts with parameters for each task.
             task_fn: The task function to call (e.g., self.translate).
@@ -661,18 +1737,20 @@ Respond in JSON:
         Returns:
             List of GrokResponse objects.
         """
-        results = []
+        async def run():
+            try:
+                return await self.batch_process_async(items, task_fn, max_workers)
+            finally:
+                await self.aclose()
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(task_fn, **item) for item in items]
-            for future in futures:
-                try:
-                    results.append(future.result())
-                except Exception as e:
-                    logger.error(f"Batch item failed: {e}")
-                    results.append(None)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run())
         
-        return results
+        # Called from inside an event loop: run the batch on its own loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, run()).result()
     
     def evaluate_batch(
         self,
@@ -688,45 +1766,64 @@ Respond in JSON:
         Returns:
             Dict with aggregate metrics and individual results.
         """
-        results = []
+        if not predictions:
+            return {
+                "average_score": 0.0,
+                "accuracy": 0.0,
+                "total_samples": 0,
+                "correct_samples": 0,
+                "metrics": {},
+                "individual_results": []
+            }
         
-        for pred in predictions:
-            if task_type == TaskType.TRANSLATION:
-                result = self.evaluate_translation(**pred)
-            elif task_type == TaskType.QA:
-                result = self.evaluate_qa_answer(**pred)
-            elif task_type == TaskType.NER:
-                result = self.evaluate_ner(**pred)
-            else:
-                raise ValueError(f"Unsupported task type: {task_type}")
-            
-            results.append(result)
+        if task_type == TaskType.TRANSLATION and len(predictions) > 1:
+            # Several translations per API call
+            results = self.batch_evaluate_translations(predictions)
+        else:
+            results = []
+            for pred in predictions:
+                if task_type == TaskType.TRANSLATION:
+                    result = self.evaluate_translation(**pred)
+                elif task_type == TaskType.QA:
+                    result = self.evaluate_qa_answer(**pred)
+                elif task_type == TaskType.NER:
+                    result = self.evaluate_ner(**pred)
+                else:
+                    raise ValueError(f"Unsupported task type: {task_type}")
+                
+                results.append(result)
         
         # Aggregate metrics
+        correct_count = 0
         if results:
-            avg_score = sum(r.score for r in results) / len(results)
-            correct_count = sum(1 for r in results if r.is_correct)
-            accuracy = correct_count / len(results)
+            n = len(results)
+            scores = np.fromiter((r.score for r in results), dtype=np.float64, count=n)
+            correct = np.fromiter((r.is_correct for r in results), dtype=np.bool_, count=n)
+            avg_score = float(scores.mean())
+            correct_count = int(correct.sum())
+            accuracy = correct_count / n
             
-            # Aggregate per-metric
-            all_metrics = {}
-            for result in results:
-                for key, value in result.metrics.items():
-                    if key not in all_metrics:
-                        all_metrics[key] = []
-                    all_metrics[key].append(value)
-            
-            avg_metrics = {k: sum(v) / len(v) for k, v in all_metrics.items()}
+            # Aggregate per-metric. Results without a metric (e.g. failed
+            # parses) are NaN and excluded from that metric's mean.
+            keys = list(dict.fromkeys(k for r in results for k in r.metrics))
+            if keys:
+                table = np.array(
+                    [[r.metrics.get(k, np.nan) for k in keys] for r in results],
+                    dtype=np.float64
+                )
+                avg_metrics = dict(zip(keys, np.nanmean(table, axis=0).tolist()))
+            else:
+                avg_metrics = {}
         else:
-            avg_score = 0
-            accuracy = 0
+            avg_score = 0.0
+            accuracy = 0.0
             avg_metrics = {}
         
         return {
             "average_score": avg_score,
             "accuracy": accuracy,
             "total_samples": len(predictions),
-            "correct_samples": correct_count if results else 0,
+            "correct_samples": correct_count,
             "metrics": avg_metrics,
             "individual_results": results
         }
@@ -752,6 +1849,17 @@ def create_client(api_key: Optional[str] = None, **kwargs) -> GrokClient:
     return GrokClient(config)
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_client(api_key: Optional[str] = None) -> GrokClient:
+    """Shared client for the quick_* helpers, memoized by api_key.
+    
+    Repeated helper calls reuse one session and connection pool. The cache
+    is keyed only by api_key; callers needing other GrokConfig settings
+    should construct a GrokClient explicitly.
+    """
+    return create_client(api_key)
+
+
 def quick_translate(text: str, source: str, target: str, api_key: Optional[str] = None) -> str:
     """Quick translation helper.
     
@@ -764,8 +1872,7 @@ def quick_translate(text: str, source: str, target: str, api_key: Optional[str]
     Returns:
         Translated text string.
     """
-    client = create_client(api_key)
-    response = client.translate(text, source, target)
+    response = _cached_client(api_key).translate(text, source, target)
     return response.text
 
 
@@ -780,8 +1887,7 @@ def quick_qa(question: str, context: str, api_key: Optional[str] = None) -> str:
     Returns:
         Answer string.
     """
-    client = create_client(api_key)
-    response = client.question_answering(question, context)
+    response = _cached_client(api_key).question_answering(question, context)
     return response.text
 
 
@@ -0,0 +1,222 @@
+# Copyright 2026 mT5 + Grok Integration
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for multilingual_t5.grok_client."""
+
+import contextlib
+import json
+from unittest import mock
+
+from absl.testing import absltest
+
+from multilingual_t5 import grok_client
+
+
+class FakeClock:
+  """Stands in for time.monotonic() and time.sleep()."""
+
+  def __init__(self):
+    self.now = 0.0
+    self.slept = []
+
+  def monotonic(self):
+    return self.now
+
+  def sleep(self, seconds):
+    self.slept.append(seconds)
+    self.now += seconds
+
+
+class FakeResponse:
+  """Minimal response object, as yielded by GrokClient._post()."""
+
+  def __init__(self, status_code=200, data=None, lines=(), text=''):
+    self.status_code = status_code
+    self.headers = {}
+    self.content = json.dumps(data).encode() if data is not None else b''
+    self.text = text
+    self._lines = lines
+
+  def iter_lines(self):
+    return iter(self._lines)
+
+
+def _completion(text, finish_reason='stop'):
+  return {
+      'model': 'grok-2',
+      'usage': {'total_tokens': 3},
+      'choices': [{
+          'message': {'role': 'assistant', 'content': text},
+          'finish_reason': finish_reason
+      }]
+  }
+
+
+def _sse(delta=None, finish_reason=None):
+  event = {'model': 'grok-2', 'choices': [{
+      'delta': {'content': delta} if delta is not None else {},
+      'finish_reason': finish_reason
+  }]}
+  return 'data: ' + json.dumps(event)
+
+
+class RateLimiterTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.clock = FakeClock()
+    self.enter_context(
+        mock.patch.object(grok_client.time, 'monotonic', self.clock.monotonic))
+    self.enter_context(
+        mock.patch.object(grok_client.time, 'sleep', self.clock.sleep))
+
+  def test_burst_up_to_capacity_does_not_wait(self):
+    limiter = grok_client.RateLimiter(requests_per_minute=5)
+    for _ in range(5):
+      limiter.wait_if_needed()
+    self.assertEmpty(self.clock.slept)
+
+  def test_waits_for_refill_when_empty(self):
+    limiter = grok_client.RateLimiter(requests_per_minute=60)
+    for _ in range(61):
+      limiter.wait_if_needed()
+    self.assertAlmostEqual(sum(self.clock.slept), 1.0)
+
+  def test_refill_is_capped_at_capacity(self):
+    limiter = grok_client.RateLimiter(requests_per_minute=2)
+    self.clock.now = 3600.0
+    limiter.wait_if_needed()
+    self.assertEqual(limiter.tokens, 1.0)
+
+
+class StreamAccumulatorTest(absltest.TestCase):
+
+  def test_assembles_deltas(self):
+    accumulator = grok_client._StreamAccumulator('grok-2')
+    self.assertFalse(accumulator.feed(': keep-alive'))
+    self.assertFalse(accumulator.feed(_sse('Hola')))
+    self.assertFalse(accumulator.feed(_sse(' mundo').encode()))
+    self.assertTrue(accumulator.feed(_sse(finish_reason='stop')))
+    self.assertEqual(
+        accumulator.result()['choices'][0],
+        {'message': {'role': 'assistant', 'content': 'Hola mundo'},
+         'finish_reason': 'stop'})
+
+  def test_done_marker_ends_stream(self):
+    accumulator = grok_client._StreamAccumulator('grok-2')
+    accumulator.feed(_sse('text'))
+    self.assertTrue(accumulator.feed('data: [DONE]'))
+    self.assertEqual(accumulator.result()['choices'][0]['finish_reason'],
+                     'unknown')
+
+  def test_stop_on_json(self):
+    accumulator = grok_client._StreamAccumulator('grok-2', stop_on_json=True)
+    self.assertFalse(accumulator.feed(_sse('{"score": ')))
+    self.assertTrue(accumulator.feed(_sse('7} and more')))
+    result = accumulator.result()['choices'][0]
+    self.assertEqual(result['message']['content'], '{"score": 7}')
+    self.assertEqual(result['finish_reason'], 'json_complete')
+
+
+class GrokClientTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.enter_context(mock.patch.object(grok_client.time, 'sleep'))
+    self.client = grok_client.GrokClient(grok_client.GrokConfig(
+        api_key='test-key', temperature=0.0, retry_delay=0.0))
+    self.responses = []
+    self.post = self.enter_context(mock.patch.object(
+        self.client, '_post', side_effect=self._post))
+
+  def _post(self, body, stream=False):
+    del body, stream  # Unused.
+    return contextlib.nullcontext(self.responses.pop(0))
+
+  def _request(self, **kwargs):
+    return self.client._make_request([{'role': 'user', 'content': 'hi'}],
+                                     **kwargs)
+
+  def test_cache_key(self):
+    payload = self.client._build_payload([{'role': 'user', 'content': 'hi'}])
+    self.assertEqual(self.client._cache_key(payload),
+                     self.client._cache_key(dict(payload)))
+    self.assertNotEqual(self.client._cache_key(payload),
+                        self.client._cache_key({**payload, 'max_tokens': 1}))
+    self.assertIsNone(self.client._cache_key({**payload, 'temperature': 0.7}))
+
+  def test_cache_key_disabled(self):
+    self.client.config.cache_enabled = False
+    payload = self.client._build_payload([{'role': 'user', 'content': 'hi'}])
+    self.assertIsNone(self.client._cache_key(payload))
+
+  def test_repeated_request_is_cached(self):
+    self.responses = [FakeResponse(data=_completion('hola'))]
+    self.assertEqual(self._request().text, 'hola')
+    cached = self._request()
+    self.assertEqual(cached.text, 'hola')
+    self.assertEqual(cached.latency_ms, 0.0)
+    self.assertEqual(self.post.call_count, 1)
+
+  def test_retries_transient_status(self):
+    self.responses = [FakeResponse(status_code=503),
+                      FakeResponse(status_code=429),
+                      FakeResponse(data=_completion('ok'))]
+    self.assertEqual(self._request().text, 'ok')
+    self.assertEqual(self.post.call_count, 3)
+
+  def test_gives_up_after_max_retries(self):
+    self.responses = [FakeResponse(status_code=503)] * 3
+    with self.assertRaisesRegex(RuntimeError, 'All retries failed'):
+      self._request()
+    self.assertEqual(self.post.call_count, 3)
+
+  def test_client_error_fails_fast(self):
+    self.responses = [FakeResponse(status_code=401, text='bad key')]
+    with self.assertRaisesRegex(RuntimeError, 'HTTP 401: bad key'):
+      self._request()
+    self.assertEqual(self.post.call_count, 1)
+
+  def test_stream(self):
+    self.responses = [FakeResponse(lines=[
+        _sse('Bon'), _sse('jour'), _sse(finish_reason='stop')])]
+    response = self._request(stream=True)
+    self.assertEqual(response.text, 'Bonjour')
+    self.assertEqual(response.finish_reason, 'stop')
+
+  def test_truncated_json_stream_is_not_cached(self):
+    self.responses = [
+        FakeResponse(lines=[_sse('{"a": 1}'), _sse(' trailing')]),
+        FakeResponse(data=_completion('{"a": 1} trailing')),
+    ]
+    self.assertEqual(self._request(stream=True, stop_on_json=True).text,
+                     '{"a": 1}')
+    self.assertEqual(self._request().text, '{"a": 1} trailing')
+    self.assertEqual(self.post.call_count, 2)
+
+  def test_concurrency_limit(self):
+    # Unmeasured latency leaves the caller's limit in place
+    self.assertEqual(self.client._concurrency_limit(8), 8)
+    self.client._record_latency(1000.0)
+    # 60 RPM * 1s is one request in flight, but never below a quarter of
+    # the caller's limit
+    self.assertEqual(self.client._concurrency_limit(16), 4)
+    self.assertEqual(self.client._concurrency_limit(5), 2)
+    self.assertEqual(self.client._concurrency_limit(2), 1)
+    self.client.config.rate_limit_rpm = 1200
+    self.assertEqual(self.client._concurrency_limit(64), 20)
+
+
+if __name__ == '__main__':
+  absltest.main()
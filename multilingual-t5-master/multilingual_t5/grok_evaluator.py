@@ -14,21 +14,58 @@ supporting all major mT5 benchmark tasks.
 
 import json
 import csv
+import re
 import time
+import functools
+import gzip
+import hashlib
+import queue
+import sqlite3
+import sys
+import threading
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, asdict
+from statistics import fmean
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
+from dataclasses import asdict, dataclass, is_dataclass, replace
 from datetime import datetime
+from enum import Enum
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, count, islice, repeat
 
 from multilingual_t5.grok_client import (
-    GrokClient, GrokConfig, GrokModel, TaskType, 
+    GrokClient, GrokConfig, GrokModel, GrokResponse, TaskType, 
     EvaluationResult, create_client
 )
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: datasets are then loaded whole with json.load
+    ijson = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Batch job states after which the job makes no further progress
+_BATCH_FINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# First "paraphrase" in a judgment, with the negation before it (if any) in
+# group 1: "not_paraphrase", "Not a paraphrase", "not really paraphrases".
+_PARAPHRASE_RE = re.compile(r"(?<![a-z])(not(?![a-z])[^.]{0,40}?)?paraphrase", re.IGNORECASE)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize enums (e.g. the TaskType in a report config) by value."""
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 @dataclass
 class EvaluationConfig:
@@ -36,10 +73,11 @@ class EvaluationConfig:
     task_type: TaskType
     languages: List[str]
     output_dir: str = "./eval_results"
-    save_individual: bool = True
+    save_individual: bool = False  # Include per-sample results in the saved report
     strict_mode: bool = True  # Harsh evaluation
     batch_size: int = 10
     max_samples: Optional[int] = None
+    always_consult_judge: bool = False  # Ask Grok even when gold labels decide (NLI/paraphrase)
 
 
 @dataclass
@@ -54,15 +92,55 @@ class EvaluationReport:
     aggregate_metrics: Dict[str, float]
     errors: List[Dict[str, Any]]
     config: Dict[str, Any]
+    # Per-sample results, in input order; only with EvaluationConfig.save_individual
+    individual_results: Optional[List[Dict[str, Any]]] = None
+    
+    def _to_json_bytes(self) -> bytes:
+        # Built by hand rather than with asdict(), which deep-copies every
+        # nested dict and list (including all errors) before serializing.
+        data = {
+            "task_name": self.task_name,
+            "timestamp": self.timestamp,
+            "total_samples": self.total_samples,
+            "overall_score": self.overall_score,
+            "accuracy": self.accuracy,
+            "metrics_by_language": self.metrics_by_language,
+            "aggregate_metrics": self.aggregate_metrics,
+            "errors": self.errors,
+            "config": self.config,
+        }
+        if self.individual_results is not None:
+            data["individual_results"] = self.individual_results
+        if orjson is not None:
+            return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2, default=_json_default).encode("utf-8")
     
     def to_json(self) -> str:
         """Convert report to JSON string."""
-        return json.dumps(asdict(self), indent=2)
+        return self._to_json_bytes().decode("utf-8")
     
-    def save(self, filepath: str):
-        """Save report to file."""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(self.to_json())
+    def save(self, filepath: str, compress: bool = True) -> str:
+        """Save report to file.
+        
+        Args:
+            filepath: Destination path.
+            compress: Write gzipped JSON, adding a ".gz" suffix to filepath
+                      if missing. Reports with long error lists shrink
+                      several-fold.
+            
+        Returns:
+            The path written.
+        """
+        if not compress:
+            with open(filepath, 'wb') as f:
+                f.write(self._to_json_bytes())
+            return filepath
+        
+        if not filepath.endswith(".gz"):
+            filepath += ".gz"
+        with gzip.open(filepath, 'wb', compresslevel=3) as f:
+            f.write(self._to_json_bytes())
+        return filepath
     
     def print_summary(self):
         """Print a formatted summary of the evaluation."""
@@ -81,7 +159,7 @@ class EvaluationReport:
         print("-"*40)
         print("🌍 Metrics by Language:")
         for lang, metrics in self.metrics_by_language.items():
-            avg = sum(metrics.values()) / len(metrics) if metrics else 0
+            avg = fmean(metrics.values()) if metrics else 0
             print(f"   {lang}: {avg:.2%}")
         if self.errors:
             print("-"*40)
@@ -89,6 +167,204 @@ class EvaluationReport:
         print("="*80 + "\n")
 
 
+class _ReportAccumulator:
+    """Running sums for an evaluation report.
+    
+    Results are folded into per-language, per-metric (sum, count) pairs as
+    they arrive, so memory is bounded by the number of metrics and languages
+    rather than the number of samples. Aggregate metrics are reduced from
+    the per-language columns once, at report time, instead of keeping a
+    second set of sums updated for every sample. Individual results are
+    only kept when asked for (EvaluationConfig.save_individual).
+    """
+    
+    def __init__(self, keep_results: bool = False):
+        """Initialize empty sums.
+        
+        Args:
+            keep_results: Also keep every (index, lang, result) added, for
+                          the report's individual_results.
+        """
+        self.total = 0
+        self.score_sum = 0.0
+        self.correct = 0
+        self.lang_sums = defaultdict(lambda: defaultdict(lambda: [0.0, 0]))
+        self.results: Optional[List[Tuple[int, str, EvaluationResult]]] = [] if keep_results else None
+    
+    def add(self, lang: str, result: EvaluationResult, index: int):
+        """Fold one result, for the sample at index, into the running sums."""
+        self.total += 1
+        self.score_sum += result.score
+        if result.is_correct:
+            self.correct += 1
+        lang_sums = self.lang_sums[lang]
+        for key, value in result.metrics.items():
+            sums = lang_sums[key]
+            sums[0] += value
+            sums[1] += 1
+        if self.results is not None:
+            self.results.append((index, lang, result))
+    
+    def merge(self, other: "_ReportAccumulator"):
+        """Add another accumulator's sums (e.g. from another language) into this one."""
+        self.total += other.total
+        self.score_sum += other.score_sum
+        self.correct += other.correct
+        for lang, lang_sums in other.lang_sums.items():
+            merged = self.lang_sums[lang]
+            for key, (total, count) in lang_sums.items():
+                sums = merged[key]
+                sums[0] += total
+                sums[1] += count
+        if self.results is not None and other.results:
+            self.results.extend(other.results)
+    
+    def metric_sums(self) -> Dict[str, List[float]]:
+        """Reduce the per-language sums to overall (sum, count) per metric."""
+        totals = defaultdict(lambda: [0.0, 0])
+        for lang_sums in self.lang_sums.values():
+            for key, (total, count) in lang_sums.items():
+                sums = totals[key]
+                sums[0] += total
+                sums[1] += count
+        return totals
+
+
+def _prompt_fingerprint(client_type: type) -> str:
+    """Hash the prompt text a client class sends.
+    
+    Covers the module's _SYS_* system prompts and every string constant in
+    the class's methods (which includes the user prompt templates), so
+    editing any prompt changes the fingerprint.
+    """
+    digest = hashlib.sha256()
+    
+    def add_code(code):
+        for const in code.co_consts:
+            if isinstance(const, str):
+                digest.update(const.encode())
+            elif hasattr(const, "co_consts"):
+                add_code(const)
+    
+    for cls in client_type.__mro__:
+        module = sys.modules.get(cls.__module__)
+        for name, value in sorted(vars(module).items()) if module else ():
+            if name.startswith("_SYS_") and isinstance(value, str):
+                digest.update(value.encode())
+        for _, attr in sorted(vars(cls).items()):
+            code = getattr(attr, "__code__", None)
+            if code is not None:
+                add_code(code)
+    return digest.hexdigest()
+
+
+# Result dataclasses the judge cache can store, by the type tag saved with them
+_CACHED_TYPES = {cls.__name__: cls for cls in (EvaluationResult, GrokResponse)}
+
+
+def _encode_cached(result: Any) -> bytes:
+    """Serialize a judge call result (a result dataclass or plain JSON) to JSON bytes."""
+    if is_dataclass(result):
+        data = {"type": type(result).__name__, "value": asdict(result)}
+    else:
+        data = {"type": None, "value": result}
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default)
+    return json.dumps(data, default=_json_default).encode("utf-8")
+
+
+def _decode_cached(blob: bytes) -> Any:
+    """Inverse of _encode_cached."""
+    data = orjson.loads(blob) if orjson is not None else json.loads(blob)
+    if data["type"] is None:
+        return data["value"]
+    return _CACHED_TYPES[data["type"]](**data["value"])
+
+
+class _CachedClient:
+    """GrokClient proxy that persists judge call results in SQLite.
+    
+    Results are keyed by method, model, the canonical JSON of the call
+    arguments, SCHEMA_VERSION and a fingerprint of the client's prompts,
+    so re-running an evaluation (e.g. to recompute metrics) reads from
+    disk instead of calling the API again, while a changed prompt or
+    result format misses. Other attributes pass through to the wrapped
+    client.
+    """
+    
+    # Bump when the cached result types change shape
+    SCHEMA_VERSION = 2
+    
+    CACHED_METHODS = frozenset({
+        "evaluate_qa_answer", "evaluate_ner", "evaluate_translation",
+        "natural_language_inference", "paraphrase_detection",
+        "batch_natural_language_inference", "batch_paraphrase_detection",
+    })
+    
+    def __init__(self, client: GrokClient, path: str, ttl: Optional[float] = None):
+        """Open (or create) the cache.
+        
+        Args:
+            client: GrokClient to wrap.
+            path: SQLite database file.
+            ttl: Seconds an entry stays valid; None keeps entries forever.
+        """
+        self._client = client
+        self._ttl = ttl
+        self._fingerprint = _prompt_fingerprint(type(client))
+        self._lock = threading.Lock()
+        # Shared by the dispatch threads; access is serialized by _lock
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, response BLOB, ts INTEGER)"
+        )
+        self._db.commit()
+    
+    def _key(self, name: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+        canonical = json.dumps(
+            {
+                "task": name,
+                "version": self.SCHEMA_VERSION,
+                "prompts": self._fingerprint,
+                "model": self._client.config.model.value,
+                "args": args,
+                "kwargs": kwargs,
+            },
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+    
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if name not in self.CACHED_METHODS:
+            return attr
+        
+        @functools.wraps(attr)
+        def cached(*args, **kwargs):
+            key = self._key(name, args, kwargs)
+            oldest = 0 if self._ttl is None else int(time.time() - self._ttl)
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT response FROM cache WHERE key=? AND ts>=?", (key, oldest)
+                ).fetchone()
+            if row is not None:
+                return _decode_cached(row[0])
+            
+            result = attr(*args, **kwargs)
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                    (key, _encode_cached(result), int(time.time()))
+                )
+                self._db.commit()
+            return result
+        
+        return cached
+
+
 class EvaluationRunner:
     """Runner for evaluating NLP tasks using Grok API."""
     
@@ -102,19 +378,35 @@ class EvaluationRunner:
         "he": "Hebrew", "sw": "Swahili", "ur": "Urdu", "bn": "Bengali"
     }
     
+    # Report titles per task
+    TASK_NAMES = {
+        TaskType.QA: "Question Answering (XQuAD/MLQA)",
+        TaskType.NLI: "Natural Language Inference (XNLI)",
+        TaskType.NER: "Named Entity Recognition (WikiANN)",
+        TaskType.TRANSLATION: "Translation Quality",
+        TaskType.PARAPHRASE: "Paraphrase Detection (PAWS-X)",
+    }
+    
     def __init__(
         self,
         grok_client: Optional[GrokClient] = None,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        cache_path: Optional[str] = None,
+        cache_ttl: Optional[float] = None
     ):
         """Initialize the evaluation runner.
         
         Args:
             grok_client: Optional pre-configured GrokClient.
             api_key: Optional API key (used if grok_client not provided).
+            cache_path: Optional SQLite file (e.g. "grok_cache.db") caching
+                        judge results across runs. None disables the cache.
+            cache_ttl: Seconds a cached judge result stays valid; None keeps
+                       results until the prompts change.
         """
         self.client = grok_client or create_client(api_key)
-        self.results_cache = []
+        if cache_path:
+            self.client = _CachedClient(self.client, cache_path, ttl=cache_ttl)
     
     def _create_output_dir(self, output_dir: str) -> Path:
         """Create output directory if it doesn't exist."""
@@ -122,20 +414,82 @@ class EvaluationRunner:
         path.mkdir(parents=True, exist_ok=True)
         return path
     
+    def _samples(
+        self,
+        predictions: Iterable[Dict[str, Any]],
+        gold: Optional[Iterable[Any]] = None
+    ) -> Iterator[Tuple[int, Dict[str, Any], Any]]:
+        """Pair predictions with their index and gold label (None past its end)."""
+        return zip(count(), predictions, chain(gold or (), repeat(None)))
+    
+    def _dispatch(
+        self,
+        evaluate_one,
+        samples,
+        config: EvaluationConfig,
+        batched: bool = False,
+        executor: Optional[ThreadPoolExecutor] = None
+    ):
+        """Run evaluate_one(pred, gold) over (index, pred, gold) samples concurrently.
+        
+        Calls are made in waves of config.batch_size, all in flight at once,
+        since the judge calls are bound by network latency rather than CPU.
+        Only one wave is held at a time, so samples may come from a lazy
+        stream.
+        
+        With batched=True, evaluate_one instead takes a list of up to
+        config.batch_size (pred, gold) pairs and returns one result per pair,
+        so each call judges a whole chunk; a failed call fails its chunk.
+        
+        Calls run on executor if one is given (so several dispatches can
+        share one bounded pool), otherwise on a pool of config.batch_size
+        threads owned by this call.
+        
+        Yields:
+            (index, prediction, result, error) tuples in input order; exactly
+            one of result and error is None.
+        """
+        batch_size = max(1, config.batch_size)
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=batch_size) as executor:
+                yield from self._dispatch(evaluate_one, samples, config, batched, executor)
+            return
+        
+        samples = islice(samples, config.max_samples or None)
+        per_call = batch_size if batched else 1
+        calls = iter(lambda: list(islice(samples, per_call)), [])
+        
+        def run(call):
+            try:
+                if batched:
+                    return evaluate_one([(pred, gold) for _, pred, gold in call]), None
+                _, pred, gold = call[0]
+                return [evaluate_one(pred, gold)], None
+            except Exception as e:
+                return None, e
+        
+        while True:
+            wave = list(islice(calls, batch_size))
+            if not wave:
+                break
+            for call, (results, error) in zip(wave, executor.map(run, wave)):
+                for n, (i, pred, _) in enumerate(call):
+                    yield i, pred, None if error is not None else results[n], error
+    
     # =========================================================================
     # XQuAD / MLQA Style QA Evaluation
     # =========================================================================
     
     def evaluate_qa(
         self,
-        predictions: List[Dict[str, Any]],
+        predictions: Iterable[Dict[str, Any]],
         gold_answers: Optional[List[str]] = None,
         config: Optional[EvaluationConfig] = None
     ) -> EvaluationReport:
         """Evaluate QA predictions harshly.
         
         Args:
-            predictions: List of dicts with keys:
+            predictions: Iterable of dicts with keys:
                 - question: str
                 - context: str
                 - predicted_answer: str
@@ -151,43 +505,44 @@ class EvaluationRunner:
             languages=["en"]
         )
         
-        results_by_lang = {}
-        all_results = []
+        accumulator, errors = self._evaluate_qa(self._samples(predictions, gold_answers), config)
+        return self._create_report(
+            task_name=self.TASK_NAMES[TaskType.QA],
+            accumulator=accumulator,
+            errors=errors,
+            config=config
+        )
+    
+    def _evaluate_qa(
+        self,
+        samples: Iterable[Tuple[int, Dict[str, Any], Any]],
+        config: EvaluationConfig,
+        executor: Optional[ThreadPoolExecutor] = None
+    ) -> Tuple[_ReportAccumulator, List[Dict[str, Any]]]:
+        """Evaluate (index, pred, gold) samples into (accumulator, errors)."""
+        accumulator = _ReportAccumulator(keep_results=config.save_individual)
         errors = []
         
-        for i, pred in enumerate(predictions):
-            if config.max_samples and i >= config.max_samples:
-                break
+        def evaluate_one(pred, gold):
+            return self.client.evaluate_qa_answer(
+                question=pred["question"],
+                context=pred["context"],
+                predicted_answer=pred["predicted_answer"],
+                gold_answer=gold
+            )
+        
+        for i, pred, result, error in self._dispatch(evaluate_one, samples, config, executor=executor):
+            if error is not None:
+                logger.error("Error evaluating sample %d: %s", i, error)
+                errors.append({"index": i, "error": str(error), "sample": pred})
+                continue
             
             lang = pred.get("language", "en")
-            gold = gold_answers[i] if gold_answers and i < len(gold_answers) else None
+            accumulator.add(lang, result, i)
             
-            try:
-                result = self.client.evaluate_qa_answer(
-                    question=pred["question"],
-                    context=pred["context"],
-                    predicted_answer=pred["predicted_answer"],
-                    gold_answer=gold
-                )
-                
-                if lang not in results_by_lang:
-                    results_by_lang[lang] = []
-                results_by_lang[lang].append(result)
-                all_results.append(result)
-                
-                logger.info(f"[{i+1}/{len(predictions)}] {lang}: Score={result.score:.2f}")
-                
-            except Exception as e:
-                logger.error(f"Error evaluating sample {i}: {e}")
-                errors.append({"index": i, "error": str(e), "sample": pred})
+            logger.info("[%d] %s: Score=%.2f", i + 1, lang, result.score)
         
-        return self._create_report(
-            task_name="Question Answering (XQuAD/MLQA)",
-            results_by_lang=results_by_lang,
-            all_results=all_results,
-            errors=errors,
-            config=config
-        )
+        return accumulator, errors
     
     # =========================================================================
     # XNLI Style NLI Evaluation
@@ -195,14 +550,14 @@ class EvaluationRunner:
     
     def evaluate_nli(
         self,
-        predictions: List[Dict[str, Any]],
+        predictions: Iterable[Dict[str, Any]],
         gold_labels: Optional[List[str]] = None,
         config: Optional[EvaluationConfig] = None
     ) -> EvaluationReport:
         """Evaluate NLI predictions.
         
         Args:
-            predictions: List of dicts with keys:
+            predictions: Iterable of dicts with keys:
                 - premise: str
                 - hypothesis: str
                 - predicted_label: str
@@ -218,61 +573,47 @@ class EvaluationRunner:
             languages=["en"]
         )
         
-        results_by_lang = {}
-        all_results = []
+        accumulator, errors = self._evaluate_nli(self._samples(predictions, gold_labels), config)
+        return self._create_report(
+            task_name=self.TASK_NAMES[TaskType.NLI],
+            accumulator=accumulator,
+            errors=errors,
+            config=config
+        )
+    
+    def _evaluate_nli(
+        self,
+        samples: Iterable[Tuple[int, Dict[str, Any], Any]],
+        config: EvaluationConfig,
+        executor: Optional[ThreadPoolExecutor] = None
+    ) -> Tuple[_ReportAccumulator, List[Dict[str, Any]]]:
+        """Evaluate (index, pred, gold) samples into (accumulator, errors)."""
+        accumulator = _ReportAccumulator(keep_results=config.save_individual)
         errors = []
         
-        for i, pred in enumerate(predictions):
-            if config.max_samples and i >= config.max_samples:
-                break
+        def evaluate_chunk(chunk):
+            # Get Grok's classifications, several pairs per request, for the
+            # samples whose correctness is not already settled by gold
+            labels = [None] * len(chunk)
+            ask = [n for n, (_, gold) in enumerate(chunk) if self._needs_judge(TaskType.NLI, gold, config)]
+            if ask:
+                judged = self.client.batch_natural_language_inference(
+                    [(chunk[n][0]["premise"], chunk[n][0]["hypothesis"]) for n in ask]
+                )
+                for n, label in zip(ask, judged):
+                    labels[n] = label
+            return [self._nli_result(pred, gold, label) for (pred, gold), label in zip(chunk, labels)]
+        
+        for i, pred, result, error in self._dispatch(evaluate_chunk, samples, config, batched=True, executor=executor):
+            if error is not None:
+                logger.error("Error evaluating sample %d: %s", i, error)
+                errors.append({"index": i, "error": str(error)})
+                continue
             
             lang = pred.get("language", "en")
-            gold = gold_labels[i] if gold_labels and i < len(gold_labels) else None
-            
-            try:
-                # Get Grok's classification
-                response = self.client.natural_language_inference(
-                    premise=pred["premise"],
-                    hypothesis=pred["hypothesis"],
-                    language=lang
-                )
-                
-                grok_label = response.text.strip().lower()
-                pred_label = pred["predicted_label"].strip().lower()
-                
-                # Check if prediction matches Grok's judgment
-                is_correct = pred_label == grok_label
-                if gold:
-                    is_correct = pred_label == gold.strip().lower()
-                
-                result = EvaluationResult(
-                    score=1.0 if is_correct else 0.0,
-                    metrics={"accuracy": 1.0 if is_correct else 0.0},
-                    feedback=f"Predicted: {pred_label}, Expected: {gold or grok_label}",
-                    is_correct=is_correct,
-                    details={
-                        "predicted": pred_label,
-                        "expected": gold or grok_label,
-                        "grok_judgment": grok_label
-                    }
-                )
-                
-                if lang not in results_by_lang:
-                    results_by_lang[lang] = []
-                results_by_lang[lang].append(result)
-                all_results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Error evaluating sample {i}: {e}")
-                errors.append({"index": i, "error": str(e)})
+            accumulator.add(lang, result, i)
         
-        return self._create_report(
-            task_name="Natural Language Inference (XNLI)",
-            results_by_lang=results_by_lang,
-            all_results=all_results,
-            errors=errors,
-            config=config
-        )
+        return accumulator, errors
     
     # =========================================================================
     # WikiANN Style NER Evaluation
@@ -280,14 +621,14 @@ class EvaluationRunner:
     
     def evaluate_ner(
         self,
-        predictions: List[Dict[str, Any]],
+        predictions: Iterable[Dict[str, Any]],
         gold_entities: Optional[List[str]] = None,
         config: Optional[EvaluationConfig] = None
     ) -> EvaluationReport:
         """Evaluate NER predictions harshly.
         
         Args:
-            predictions: List of dicts with keys:
+            predictions: Iterable of dicts with keys:
                 - text: str
                 - predicted_entities: str (format: "TYPE: entity $$ ...")
                 - language: str (optional)
@@ -302,40 +643,41 @@ class EvaluationRunner:
             languages=["en"]
         )
         
-        results_by_lang = {}
-        all_results = []
+        accumulator, errors = self._evaluate_ner(self._samples(predictions, gold_entities), config)
+        return self._create_report(
+            task_name=self.TASK_NAMES[TaskType.NER],
+            accumulator=accumulator,
+            errors=errors,
+            config=config
+        )
+    
+    def _evaluate_ner(
+        self,
+        samples: Iterable[Tuple[int, Dict[str, Any], Any]],
+        config: EvaluationConfig,
+        executor: Optional[ThreadPoolExecutor] = None
+    ) -> Tuple[_ReportAccumulator, List[Dict[str, Any]]]:
+        """Evaluate (index, pred, gold) samples into (accumulator, errors)."""
+        accumulator = _ReportAccumulator(keep_results=config.save_individual)
         errors = []
         
-        for i, pred in enumerate(predictions):
-            if config.max_samples and i >= config.max_samples:
-                break
+        def evaluate_one(pred, gold):
+            return self.client.evaluate_ner(
+                text=pred["text"],
+                predicted_entities=pred["predicted_entities"],
+                gold_entities=gold
+            )
+        
+        for i, pred, result, error in self._dispatch(evaluate_one, samples, config, executor=executor):
+            if error is not None:
+                logger.error("Error evaluating sample %d: %s", i, error)
+                errors.append({"index": i, "error": str(error)})
+                continue
             
             lang = pred.get("language", "en")
-            gold = gold_entities[i] if gold_entities and i < len(gold_entities) else None
-            
-            try:
-                result = self.client.evaluate_ner(
-                    text=pred["text"],
-                    predicted_entities=pred["predicted_entities"],
-                    gold_entities=gold
-                )
-                
-                if lang not in results_by_lang:
-                    results_by_lang[lang] = []
-                results_by_lang[lang].append(result)
-                all_results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Error evaluating sample {i}: {e}")
-                errors.append({"index": i, "error": str(e)})
+            accumulator.add(lang, result, i)
         
-        return self._create_report(
-            task_name="Named Entity Recognition (WikiANN)",
-            results_by_lang=results_by_lang,
-            all_results=all_results,
-            errors=errors,
-            config=config
-        )
+        return accumulator, errors
     
     # =========================================================================
     # Translation Evaluation
@@ -343,14 +685,14 @@ class EvaluationRunner:
     
     def evaluate_translation(
         self,
-        predictions: List[Dict[str, Any]],
+        predictions: Iterable[Dict[str, Any]],
         references: Optional[List[str]] = None,
         config: Optional[EvaluationConfig] = None
     ) -> EvaluationReport:
         """Evaluate translation quality harshly.
         
         Args:
-            predictions: List of dicts with keys:
+            predictions: Iterable of dicts with keys:
                 - source_text: str
                 - translation: str
                 - source_lang: str
@@ -366,42 +708,43 @@ class EvaluationRunner:
             languages=["en", "es"]
         )
         
-        results_by_lang = {}
-        all_results = []
+        accumulator, errors = self._evaluate_translation(self._samples(predictions, references), config)
+        return self._create_report(
+            task_name=self.TASK_NAMES[TaskType.TRANSLATION],
+            accumulator=accumulator,
+            errors=errors,
+            config=config
+        )
+    
+    def _evaluate_translation(
+        self,
+        samples: Iterable[Tuple[int, Dict[str, Any], Any]],
+        config: EvaluationConfig,
+        executor: Optional[ThreadPoolExecutor] = None
+    ) -> Tuple[_ReportAccumulator, List[Dict[str, Any]]]:
+        """Evaluate (index, pred, gold) samples into (accumulator, errors)."""
+        accumulator = _ReportAccumulator(keep_results=config.save_individual)
         errors = []
         
-        for i, pred in enumerate(predictions):
-            if config.max_samples and i >= config.max_samples:
-                break
+        def evaluate_one(pred, ref):
+            return self.client.evaluate_translation(
+                source_text=pred["source_text"],
+                translation=pred["translation"],
+                reference=ref,
+                source_lang=pred.get("source_lang", "en"),
+                target_lang=pred.get("target_lang", "es")
+            )
+        
+        for i, pred, result, error in self._dispatch(evaluate_one, samples, config, executor=executor):
+            if error is not None:
+                logger.error("Error evaluating sample %d: %s", i, error)
+                errors.append({"index": i, "error": str(error)})
+                continue
             
             lang_pair = f"{pred.get('source_lang', 'en')}-{pred.get('target_lang', 'es')}"
-            ref = references[i] if references and i < len(references) else None
-            
-            try:
-                result = self.client.evaluate_translation(
-                    source_text=pred["source_text"],
-                    translation=pred["translation"],
-                    reference=ref,
-                    source_lang=pred.get("source_lang", "en"),
-                    target_lang=pred.get("target_lang", "es")
-                )
-                
-                if lang_pair not in results_by_lang:
-                    results_by_lang[lang_pair] = []
-                results_by_lang[lang_pair].append(result)
-                all_results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Error evaluating sample {i}: {e}")
-                errors.append({"index": i, "error": str(e)})
+            accumulator.add(lang_pair, result, i)
         
-        return self._create_report(
-            task_name="Translation Quality",
-            results_by_lang=results_by_lang,
-            all_results=all_results,
-            errors=errors,
-            config=config
-        )
+        return accumulator, errors
     
     # =========================================================================
     # PAWS-X Style Paraphrase Evaluation
@@ -409,14 +752,14 @@ class EvaluationRunner:
     
     def evaluate_paraphrase(
         self,
-        predictions: List[Dict[str, Any]],
+        predictions: Iterable[Dict[str, Any]],
         gold_labels: Optional[List[bool]] = None,
         config: Optional[EvaluationConfig] = None
     ) -> EvaluationReport:
         """Evaluate paraphrase detection.
         
         Args:
-            predictions: List of dicts with keys:
+            predictions: Iterable of dicts with keys:
                 - sentence1: str
                 - sentence2: str
                 - predicted_label: bool
@@ -432,115 +775,173 @@ class EvaluationRunner:
             languages=["en"]
         )
         
-        results_by_lang = {}
-        all_results = []
+        accumulator, errors = self._evaluate_paraphrase(self._samples(predictions, gold_labels), config)
+        return self._create_report(
+            task_name=self.TASK_NAMES[TaskType.PARAPHRASE],
+            accumulator=accumulator,
+            errors=errors,
+            config=config
+        )
+    
+    def _evaluate_paraphrase(
+        self,
+        samples: Iterable[Tuple[int, Dict[str, Any], Any]],
+        config: EvaluationConfig,
+        executor: Optional[ThreadPoolExecutor] = None
+    ) -> Tuple[_ReportAccumulator, List[Dict[str, Any]]]:
+        """Evaluate (index, pred, gold) samples into (accumulator, errors)."""
+        accumulator = _ReportAccumulator(keep_results=config.save_individual)
         errors = []
         
-        for i, pred in enumerate(predictions):
-            if config.max_samples and i >= config.max_samples:
-                break
+        def evaluate_chunk(chunk):
+            labels = [None] * len(chunk)
+            ask = [n for n, (_, gold) in enumerate(chunk) if self._needs_judge(TaskType.PARAPHRASE, gold, config)]
+            if ask:
+                judged = self.client.batch_paraphrase_detection(
+                    [(chunk[n][0]["sentence1"], chunk[n][0]["sentence2"]) for n in ask]
+                )
+                for n, label in zip(ask, judged):
+                    labels[n] = label
+            return [
+                self._paraphrase_result(pred, gold, label)
+                for (pred, gold), label in zip(chunk, labels)
+            ]
+        
+        for i, pred, result, error in self._dispatch(evaluate_chunk, samples, config, batched=True, executor=executor):
+            if error is not None:
+                logger.error("Error evaluating sample %d: %s", i, error)
+                errors.append({"index": i, "error": str(error)})
+                continue
             
             lang = pred.get("language", "en")
-            gold = gold_labels[i] if gold_labels and i < len(gold_labels) else None
-            
-            try:
-                response = self.client.paraphrase_detection(
-                    sentence1=pred["sentence1"],
-                    sentence2=pred["sentence2"],
-                    language=lang
-                )
-                
-                grok_is_paraphrase = "paraphrase" in response.text.lower() and "not" not in response.text.lower()
-                pred_is_paraphrase = pred["predicted_label"]
-                
-                is_correct = pred_is_paraphrase == (gold if gold is not None else grok_is_paraphrase)
-                
-                result = EvaluationResult(
-                    score=1.0 if is_correct else 0.0,
-                    metrics={"accuracy": 1.0 if is_correct else 0.0},
-                    feedback=f"Predicted: {pred_is_paraphrase}, Expected: {gold if gold is not None else grok_is_paraphrase}",
-                    is_correct=is_correct,
-                    details={"grok_judgment": grok_is_paraphrase}
-                )
-                
-                if lang not in results_by_lang:
-                    results_by_lang[lang] = []
-                results_by_lang[lang].append(result)
-                all_results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Error evaluating sample {i}: {e}")
-                errors.append({"index": i, "error": str(e)})
+            accumulator.add(lang, result, i)
         
-        return self._create_report(
-            task_name="Paraphrase Detection (PAWS-X)",
-            results_by_lang=results_by_lang,
-            all_results=all_results,
-            errors=errors,
-            config=config
-        )
+        return accumulator, errors
     
     # =========================================================================
     # Helper Methods
     # =========================================================================
     
+    def _needs_judge(self, task_type: TaskType, gold: Any, config: EvaluationConfig) -> bool:
+        """Whether a sample needs a Grok call.
+        
+        NLI and paraphrase predictions with a gold label are scored against
+        the gold label alone, so Grok's judgment would go unused unless
+        config.always_consult_judge asks for it.
+        """
+        if config.always_consult_judge:
+            return True
+        if task_type == TaskType.NLI:
+            return not gold
+        if task_type == TaskType.PARAPHRASE:
+            return gold is None
+        return True
+    
+    def _nli_result(
+        self,
+        pred: Dict[str, Any],
+        gold: Optional[str],
+        judgment: Optional[str]
+    ) -> EvaluationResult:
+        """Score an NLI prediction against gold, or Grok's label if no gold."""
+        # Normalize each label once; gold, when given, overrides Grok's judgment
+        pred_label = pred["predicted_label"].strip().lower()
+        grok_label = judgment.strip().lower() if judgment is not None else None
+        expected = gold.strip().lower() if gold else grok_label
+        is_correct = pred_label == expected
+        
+        return EvaluationResult(
+            score=1.0 if is_correct else 0.0,
+            metrics={"accuracy": 1.0 if is_correct else 0.0},
+            feedback=f"Predicted: {pred_label}, Expected: {expected}",
+            is_correct=is_correct,
+            details={
+                "predicted": pred_label,
+                "expected": expected,
+                "grok_judgment": grok_label
+            }
+        )
+    
+    def _paraphrase_result(
+        self,
+        pred: Dict[str, Any],
+        gold: Optional[bool],
+        judgment: Optional[str]
+    ) -> EvaluationResult:
+        """Score a paraphrase prediction against gold, or Grok's judgment if no gold."""
+        grok_is_paraphrase = None
+        if judgment is not None:
+            match = _PARAPHRASE_RE.search(judgment)
+            grok_is_paraphrase = match is not None and match.group(1) is None
+        pred_is_paraphrase = pred["predicted_label"]
+        
+        is_correct = pred_is_paraphrase == (gold if gold is not None else grok_is_paraphrase)
+        
+        return EvaluationResult(
+            score=1.0 if is_correct else 0.0,
+            metrics={"accuracy": 1.0 if is_correct else 0.0},
+            feedback=f"Predicted: {pred_is_paraphrase}, Expected: {gold if gold is not None else grok_is_paraphrase}",
+            is_correct=is_correct,
+            details={"grok_judgment": grok_is_paraphrase}
+        )
+    
     def _create_report(
         self,
         task_name: str,
-        results_by_lang: Dict[str, List[EvaluationResult]],
-        all_results: List[EvaluationResult],
+        accumulator: _ReportAccumulator,
         errors: List[Dict[str, Any]],
-        config: EvaluationConfig
+        config: EvaluationConfig,
+        timestamp: Optional[str] = None
     ) -> EvaluationReport:
-        """Create an evaluation report from results."""
+        """Create an evaluation report from accumulated results.
+        
+        timestamp defaults to the current time in ISO format.
+        """
         
         # Calculate aggregate metrics
-        if all_results:
-            overall_score = sum(r.score for r in all_results) / len(all_results)
-            accuracy = sum(1 for r in all_results if r.is_correct) / len(all_results)
-            
-            # Aggregate all metrics
-            all_metrics = {}
-            for result in all_results:
-                for key, value in result.metrics.items():
-                    if key not in all_metrics:
-                        all_metrics[key] = []
-                    all_metrics[key].append(value)
-            aggregate_metrics = {k: sum(v) / len(v) for k, v in all_metrics.items()}
+        total = accumulator.total
+        if total:
+            overall_score = accumulator.score_sum / total
+            accuracy = accumulator.correct / total
         else:
             overall_score = 0.0
             accuracy = 0.0
-            aggregate_metrics = {}
+        aggregate_metrics = {k: s / n for k, (s, n) in accumulator.metric_sums().items()}
         
         # Calculate per-language metrics
-        metrics_by_lang = {}
-        for lang, results in results_by_lang.items():
-            if results:
-                lang_metrics = {}
-                for result in results:
-                    for key, value in result.metrics.items():
-                        if key not in lang_metrics:
-                            lang_metrics[key] = []
-                        lang_metrics[key].append(value)
-                metrics_by_lang[lang] = {k: sum(v) / len(v) for k, v in lang_metrics.items()}
+        metrics_by_lang = {
+            lang: {k: s / n for k, (s, n) in sums.items()}
+            for lang, sums in accumulator.lang_sums.items()
+        }
+        
+        individual_results = None
+        if accumulator.results is not None:
+            individual_results = [
+                {"index": index, "language": lang, **asdict(result)}
+                for index, lang, result in sorted(accumulator.results, key=lambda entry: entry[0])
+            ]
         
         return EvaluationReport(
             task_name=task_name,
-            timestamp=datetime.now().isoformat(),
-            total_samples=len(all_results),
+            timestamp=timestamp or datetime.now().isoformat(),
+            total_samples=total,
             overall_score=overall_score,
             accuracy=accuracy,
             metrics_by_language=metrics_by_lang,
             aggregate_metrics=aggregate_metrics,
             errors=errors,
-            config=asdict(config) if hasattr(config, '__dict__') else {}
+            # Shallow copy: the fields are primitives and a list of codes, so
+            # asdict()'s recursive deep copy is unnecessary
+            config=dict(vars(config)),
+            individual_results=individual_results
         )
     
     def run_full_evaluation(
         self,
         task_type: TaskType,
         data_path: str,
-        output_dir: str = "./eval_results"
+        output_dir: str = "./eval_results",
+        save_individual: bool = False
     ) -> EvaluationReport:
         """Run a full evaluation on a dataset file.
         
@@ -548,43 +949,282 @@ class EvaluationRunner:
             task_type: Type of task to evaluate.
             data_path: Path to JSON file with predictions.
             output_dir: Directory to save results.
+            save_individual: Also write every sample's result to the report.
             
         Returns:
             EvaluationReport with complete results.
         """
-        with open(data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        predictions = data.get("predictions", data)
-        gold = data.get("gold", None)
-        
         task_methods = {
-            TaskType.QA: self.evaluate_qa,
-            TaskType.NLI: self.evaluate_nli,
-            TaskType.NER: self.evaluate_ner,
-            TaskType.TRANSLATION: self.evaluate_translation,
-            TaskType.PARAPHRASE: self.evaluate_paraphrase,
+            TaskType.QA: self._evaluate_qa,
+            TaskType.NLI: self._evaluate_nli,
+            TaskType.NER: self._evaluate_ner,
+            TaskType.TRANSLATION: self._evaluate_translation,
+            TaskType.PARAPHRASE: self._evaluate_paraphrase,
         }
         
         if task_type not in task_methods:
             raise ValueError(f"Unsupported task type: {task_type}")
+        evaluate = task_methods[task_type]
         
         config = EvaluationConfig(
             task_type=task_type,
-            languages=list(set(p.get("language", "en") for p in predictions)),
-            output_dir=output_dir
+            languages=[],
+            output_dir=output_dir,
+            save_individual=save_individual
         )
         
-        report = task_methods[task_type](predictions, gold, config)
+        # Samples are streamed from the file into a bounded queue per
+        # language, each drained by its own worker. Languages are evaluated
+        # concurrently while only a few batches per language are in memory.
+        # The workers only feed waves into one shared pool, which holds the
+        # judge calls of at most batch_size languages at a time, so the
+        # number of calls in flight stays bounded however many languages
+        # the file has.
+        batch_size = max(1, config.batch_size)
+        executor = ThreadPoolExecutor(max_workers=batch_size * batch_size)
+        groups: Dict[str, queue.Queue] = {}
+        workers = []
+        partials = {}
+        failures = []
+        
+        def evaluate_group(key: str, group: queue.Queue):
+            samples = iter(group.get, None)
+            try:
+                partials[key] = evaluate(samples, config, executor)
+            except BaseException as e:
+                failures.append(e)
+                for _ in samples:  # Keep draining so the reader never blocks
+                    pass
+        
+        languages = set()
+        try:
+            for sample in self._iter_dataset(data_path):
+                pred = sample[1]
+                languages.add(pred.get("language", "en"))
+                key = self._group_key(task_type, pred)
+                group = groups.get(key)
+                if group is None:
+                    group = groups[key] = queue.Queue(maxsize=2 * batch_size)
+                    worker = threading.Thread(target=evaluate_group, args=(key, group), daemon=True)
+                    worker.start()
+                    workers.append(worker)
+                group.put(sample)
+        finally:
+            for group in groups.values():
+                group.put(None)
+            for worker in workers:
+                worker.join()
+            executor.shutdown()
+        if failures:
+            raise failures[0]
+        config = replace(config, languages=sorted(languages))
+        
+        accumulator = _ReportAccumulator(keep_results=config.save_individual)
+        errors = []
+        for key in groups:
+            group_accumulator, group_errors = partials[key]
+            accumulator.merge(group_accumulator)
+            errors.extend(group_errors)
+        errors.sort(key=lambda error: error["index"])
+        
+        # One clock read for both the report timestamp and its file name
+        now = datetime.now()
+        report = self._create_report(
+            task_name=self.TASK_NAMES[task_type],
+            accumulator=accumulator,
+            errors=errors,
+            config=config,
+            timestamp=now.isoformat()
+        )
+        self._save_report(report, task_type, output_dir, now)
+        return report
+    
+    def _group_key(self, task_type: TaskType, pred: Dict[str, Any]) -> str:
+        """Language (or language pair, for translation) a sample is reported under."""
+        if task_type == TaskType.TRANSLATION:
+            return f"{pred.get('source_lang', 'en')}-{pred.get('target_lang', 'es')}"
+        return pred.get("language", "en")
+    
+    def _load_dataset(self, data_path: str):
+        """Load (predictions, gold) from a dataset file."""
+        with open(data_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        if isinstance(data, list):
+            return data, None
+        return data.get("predictions", data), data.get("gold", None)
+    
+    def _iter_dataset(self, data_path: str) -> Iterator[Tuple[int, Dict[str, Any], Any]]:
+        """Yield (index, prediction, gold) samples from a dataset file.
+        
+        With ijson installed the file is parsed incrementally, reading the
+        gold array in lockstep through a second handle, so memory does not
+        grow with the file size. Otherwise the file is loaded whole.
+        """
+        if ijson is None:
+            yield from self._samples(*self._load_dataset(data_path))
+            return
         
-        # Save report
+        with open(data_path, 'rb') as f, open(data_path, 'rb') as gold_file:
+            is_list = f.read(4096).lstrip().startswith(b"[")
+            f.seek(0)
+            if is_list:
+                yield from self._samples(ijson.items(f, "item", use_float=True))
+            else:
+                yield from self._samples(
+                    ijson.items(f, "predictions.item", use_float=True),
+                    ijson.items(gold_file, "gold.item", use_float=True)
+                )
+    
+    def _save_report(
+        self,
+        report: EvaluationReport,
+        task_type: TaskType,
+        output_dir: str,
+        now: datetime
+    ):
+        """Save a report under output_dir, named by time now, and print its summary."""
         output_path = self._create_output_dir(output_dir)
-        report_file = output_path / f"{task_type.value}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        report.save(str(report_file))
+        report_file = output_path / f"{task_type.value}_{now.strftime('%Y%m%d_%H%M%S')}.json"
+        report_file = report.save(str(report_file))
         
         report.print_summary()
-        logger.info(f"Report saved to: {report_file}")
+        logger.info("Report saved to: %s", report_file)
+    
+    # =========================================================================
+    # Offline Batch API Evaluation
+    # =========================================================================
+    
+    def _batch_judgment(self, task_type: TaskType, pred: Dict[str, Any], gold: Any):
+        """Client method and keyword arguments judging one sample."""
+        client = self.client
+        if task_type == TaskType.QA:
+            return client.evaluate_qa_answer, {
+                "question": pred["question"],
+                "context": pred["context"],
+                "predicted_answer": pred["predicted_answer"],
+                "gold_answer": gold
+            }
+        if task_type == TaskType.NLI:
+            return client.natural_language_inference, {
+                "premise": pred["premise"],
+                "hypothesis": pred["hypothesis"],
+                "language": pred.get("language", "en")
+            }
+        if task_type == TaskType.NER:
+            return client.evaluate_ner, {
+                "text": pred["text"],
+                "predicted_entities": pred["predicted_entities"],
+                "gold_entities": gold
+            }
+        if task_type == TaskType.TRANSLATION:
+            return client.evaluate_translation, {
+                "source_text": pred["source_text"],
+                "translation": pred["translation"],
+                "reference": gold,
+                "source_lang": pred.get("source_lang", "en"),
+                "target_lang": pred.get("target_lang", "es")
+            }
+        if task_type == TaskType.PARAPHRASE:
+            return client.paraphrase_detection, {
+                "sentence1": pred["sentence1"],
+                "sentence2": pred["sentence2"],
+                "language": pred.get("language", "en")
+            }
+        raise ValueError(f"Unsupported task type: {task_type}")
+    
+    def run_batch_evaluation(
+        self,
+        task_type: TaskType,
+        data_path: str,
+        output_dir: str = "./eval_results",
+        poll_interval: float = 30.0,
+        save_individual: bool = False
+    ) -> EvaluationReport:
+        """Run a full evaluation through the offline Batch API.
         
+        All judge calls are submitted as a single batch job, which is cheaper
+        than live calls and not subject to the per-minute rate limit, but may
+        take hours to complete. Use for large, non-interactive runs.
+        
+        Args:
+            task_type: Type of task to evaluate.
+            data_path: Path to JSON file with predictions.
+            output_dir: Directory to save results.
+            poll_interval: Seconds between batch status checks.
+            save_individual: Also write every sample's result to the report.
+            
+        Returns:
+            EvaluationReport with complete results.
+        """
+        predictions, gold = self._load_dataset(data_path)
+        config = EvaluationConfig(
+            task_type=task_type,
+            languages=list(set(p.get("language", "en") for p in predictions)),
+            output_dir=output_dir,
+            save_individual=save_individual
+        )
+        
+        # Judge method per sample; None where gold alone decides correctness
+        judgments = []
+        batch_requests = []
+        for i, pred in enumerate(predictions):
+            sample_gold = gold[i] if gold and i < len(gold) else None
+            if not self._needs_judge(task_type, sample_gold, config):
+                judgments.append(None)
+                continue
+            task_fn, kwargs = self._batch_judgment(task_type, pred, sample_gold)
+            judgments.append(task_fn)
+            batch_requests.append(
+                self.client.batch_request(f"{task_type.value}-{i}", task_fn, **kwargs)
+            )
+        
+        responses = {}
+        status = "not submitted"
+        if batch_requests:
+            batch_id = self.client.create_batch(batch_requests)
+            logger.info("Submitted batch %s with %d requests", batch_id, len(batch_requests))
+            
+            batch = self.client.get_batch(batch_id)
+            while batch["status"] not in _BATCH_FINAL_STATES:
+                time.sleep(poll_interval)
+                batch = self.client.get_batch(batch_id)
+            status = batch["status"]
+            logger.info("Batch %s finished with status: %s", batch_id, status)
+            
+            responses = self.client.get_batch_results(batch)
+        
+        accumulator = _ReportAccumulator(keep_results=config.save_individual)
+        errors = []
+        for i, (pred, task_fn) in enumerate(zip(predictions, judgments)):
+            judgment = None
+            if task_fn is not None:
+                response = responses.get(f"{task_type.value}-{i}")
+                if response is None:
+                    errors.append({"index": i, "error": f"No batch result (status: {status})"})
+                    continue
+                judgment = response.text
+            
+            sample_gold = gold[i] if gold and i < len(gold) else None
+            if task_type == TaskType.NLI:
+                result = self._nli_result(pred, sample_gold, judgment)
+            elif task_type == TaskType.PARAPHRASE:
+                result = self._paraphrase_result(pred, sample_gold, judgment)
+            else:
+                result = self.client.batch_result(task_fn, response)
+            
+            accumulator.add(self._group_key(task_type, pred), result, i)
+        
+        # One clock read for both the report timestamp and its file name
+        now = datetime.now()
+        report = self._create_report(
+            task_name=self.TASK_NAMES[task_type],
+            accumulator=accumulator,
+            errors=errors,
+            config=config,
+            timestamp=now.isoformat()
+        )
+        self._save_report(report, task_type, output_dir, now)
         return report
 
 
@@ -605,6 +1245,10 @@ if __name__ == "__main__":
                         help="Output directory for results")
     parser.add_argument("--max-samples", type=int, default=None,
                         help="Maximum samples to evaluate")
+    parser.add_argument("--batch", action="store_true",
+                        help="Submit through the offline Batch API (cheaper, slower)")
+    parser.add_argument("--save-individual", action="store_true",
+                        help="Include every sample's result in the saved report")
     
     args = parser.parse_args()
     
@@ -617,8 +1261,10 @@ if __name__ == "__main__":
     }
     
     runner = EvaluationRunner()
-    report = runner.run_full_evaluation(
+    run = runner.run_batch_evaluation if args.batch else runner.run_full_evaluation
+    report = run(
         task_type=task_map[args.task],
         data_path=args.data,
-        output_dir=args.output
+        output_dir=args.output,
+        save_individual=args.save_individual
     )
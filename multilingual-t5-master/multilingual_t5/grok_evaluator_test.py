@@ -0,0 +1,267 @@
+# Copyright 2026 mT5 + Grok Integration
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for multilingual_t5.grok_evaluator."""
+
+import contextlib
+import json
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from absl.testing import absltest
+
+from multilingual_t5 import grok_client
+from multilingual_t5 import grok_evaluator
+
+
+def _result(score, is_correct=True, **metrics):
+  return grok_client.EvaluationResult(
+      score=score, metrics=metrics, feedback='', is_correct=is_correct,
+      details={})
+
+
+class FakeClient:
+  """GrokClient stand-in that counts judge calls instead of sending them."""
+
+  def __init__(self):
+    self.config = grok_client.GrokConfig(api_key='test-key')
+    self.calls = 0
+
+  def _judge(self, prompt):
+    del prompt  # Unused.
+    self.calls += 1
+    return _result(0.5, precision=0.5)
+
+  def evaluate_ner(self, text, predicted_entities, gold_entities=None):
+    return self._judge(f'Judge the entities {predicted_entities} in: {text}')
+
+  def batch_paraphrase_detection(self, pairs):
+    self.calls += 1
+    return ['paraphrase'] * len(pairs)
+
+  def summarize(self, text):
+    self.calls += 1
+    return text
+
+
+class RewordedClient(FakeClient):
+  """FakeClient whose judge prompt has been edited."""
+
+  def evaluate_ner(self, text, predicted_entities, gold_entities=None):
+    return self._judge(
+        f'Strictly judge the entities {predicted_entities} in: {text}')
+
+
+class ReportAccumulatorTest(absltest.TestCase):
+
+  def test_add(self):
+    accumulator = grok_evaluator._ReportAccumulator()
+    accumulator.add('en', _result(0.75, accuracy=0.75), 0)
+    accumulator.add('en', _result(0.25, is_correct=False, accuracy=0.25), 1)
+    accumulator.add('fr', _result(0.5, accuracy=0.5, fluency=1.0), 2)
+    self.assertEqual(accumulator.total, 3)
+    self.assertEqual(accumulator.score_sum, 1.5)
+    self.assertEqual(accumulator.correct, 2)
+    self.assertEqual(accumulator.lang_sums['en']['accuracy'], [1.0, 2])
+    self.assertEqual(accumulator.lang_sums['fr']['fluency'], [1.0, 1])
+    self.assertEqual(dict(accumulator.metric_sums()), {
+        'accuracy': [1.5, 3],
+        'fluency': [1.0, 1],
+    })
+    self.assertIsNone(accumulator.results)
+
+  def test_merge(self):
+    english = grok_evaluator._ReportAccumulator()
+    english.add('en', _result(1.0, accuracy=1.0), 0)
+    french = grok_evaluator._ReportAccumulator()
+    french.add('fr', _result(0.0, is_correct=False, accuracy=0.0), 1)
+    french.add('en', _result(0.5, accuracy=0.5), 2)
+    english.merge(french)
+    self.assertEqual(english.total, 3)
+    self.assertEqual(english.correct, 2)
+    self.assertEqual(english.lang_sums['en']['accuracy'], [1.5, 2])
+    self.assertEqual(english.lang_sums['fr']['accuracy'], [0.0, 1])
+
+  def test_individual_results(self):
+    accumulator = grok_evaluator._ReportAccumulator(keep_results=True)
+    accumulator.add('fr', _result(0.5), 1)
+    accumulator.add('en', _result(1.0), 0)
+    runner = grok_evaluator.EvaluationRunner(grok_client=FakeClient())
+    config = grok_evaluator.EvaluationConfig(
+        task_type=grok_client.TaskType.QA, languages=['en', 'fr'],
+        save_individual=True)
+    report = runner._create_report('QA', accumulator, [], config)
+    self.assertEqual(
+        [(r['index'], r['language'], r['score'])
+         for r in report.individual_results],
+        [(0, 'en', 1.0), (1, 'fr', 0.5)])
+    self.assertIn('individual_results', json.loads(report.to_json()))
+
+
+class ParaphraseRegexTest(absltest.TestCase):
+
+  def _is_paraphrase(self, judgment):
+    match = grok_evaluator._PARAPHRASE_RE.search(judgment)
+    return match is not None and match.group(1) is None
+
+  def test_positive(self):
+    self.assertTrue(self._is_paraphrase('paraphrase'))
+    self.assertTrue(self._is_paraphrase('Yes, these are Paraphrases.'))
+    self.assertTrue(self._is_paraphrase('Nothing differs: paraphrase'))
+
+  def test_negative(self):
+    self.assertFalse(self._is_paraphrase('not_paraphrase'))
+    self.assertFalse(self._is_paraphrase('Not a paraphrase.'))
+    self.assertFalse(self._is_paraphrase('not really paraphrases'))
+    self.assertFalse(self._is_paraphrase('The meanings differ.'))
+
+
+class CachedClientTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.path = os.path.join(self.create_tempdir().full_path, 'cache.db')
+
+  def test_cached_methods_are_read_back(self):
+    client = FakeClient()
+    cached = grok_evaluator._CachedClient(client, self.path)
+    first = cached.evaluate_ner('text', 'PER: x')
+    self.assertEqual(cached.evaluate_ner('text', 'PER: x'), first)
+    self.assertEqual(client.calls, 1)
+    cached.evaluate_ner('other text', 'PER: x')
+    self.assertEqual(client.calls, 2)
+
+  def test_persists_across_instances(self):
+    grok_evaluator._CachedClient(FakeClient(), self.path).evaluate_ner('t', 'p')
+    client = FakeClient()
+    grok_evaluator._CachedClient(client, self.path).evaluate_ner('t', 'p')
+    self.assertEqual(client.calls, 0)
+
+  def test_entries_are_json(self):
+    grok_evaluator._CachedClient(FakeClient(), self.path).evaluate_ner('t', 'p')
+    with contextlib.closing(sqlite3.connect(self.path)) as db:
+      (blob,), = db.execute('SELECT response FROM cache')
+    self.assertEqual(json.loads(blob), {
+        'type': 'EvaluationResult',
+        'value': {'score': 0.5, 'metrics': {'precision': 0.5}, 'feedback': '',
+                  'is_correct': True, 'details': {}},
+    })
+
+  def test_list_results_round_trip(self):
+    client = FakeClient()
+    cached = grok_evaluator._CachedClient(client, self.path)
+    self.assertEqual(cached.batch_paraphrase_detection([('a', 'b')]),
+                     ['paraphrase'])
+    self.assertEqual(cached.batch_paraphrase_detection([('a', 'b')]),
+                     ['paraphrase'])
+    self.assertEqual(client.calls, 1)
+
+  def test_other_methods_pass_through(self):
+    client = FakeClient()
+    cached = grok_evaluator._CachedClient(client, self.path)
+    cached.summarize('text')
+    cached.summarize('text')
+    self.assertEqual(client.calls, 2)
+    self.assertIs(cached.config, client.config)
+
+  def test_edited_prompt_misses(self):
+    grok_evaluator._CachedClient(FakeClient(), self.path).evaluate_ner('t', 'p')
+    client = RewordedClient()
+    grok_evaluator._CachedClient(client, self.path).evaluate_ner('t', 'p')
+    self.assertEqual(client.calls, 1)
+
+  def test_schema_version_misses(self):
+    grok_evaluator._CachedClient(FakeClient(), self.path).evaluate_ner('t', 'p')
+    client = FakeClient()
+    with mock.patch.object(grok_evaluator._CachedClient, 'SCHEMA_VERSION',
+                           grok_evaluator._CachedClient.SCHEMA_VERSION + 1):
+      grok_evaluator._CachedClient(client, self.path).evaluate_ner('t', 'p')
+    self.assertEqual(client.calls, 1)
+
+  def test_ttl(self):
+    client = FakeClient()
+    cached = grok_evaluator._CachedClient(client, self.path, ttl=60)
+    with mock.patch.object(grok_evaluator.time, 'time', return_value=1000.0):
+      cached.evaluate_ner('t', 'p')
+    with mock.patch.object(grok_evaluator.time, 'time', return_value=1030.0):
+      cached.evaluate_ner('t', 'p')
+    self.assertEqual(client.calls, 1)
+    with mock.patch.object(grok_evaluator.time, 'time', return_value=1061.0):
+      cached.evaluate_ner('t', 'p')
+    self.assertEqual(client.calls, 2)
+
+
+class DispatchTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.runner = grok_evaluator.EvaluationRunner(grok_client=FakeClient())
+
+  def _config(self, **kwargs):
+    return grok_evaluator.EvaluationConfig(
+        task_type=grok_client.TaskType.QA, languages=['en'], **kwargs)
+
+  def _dispatch(self, evaluate_one, n, config, **kwargs):
+    samples = self.runner._samples(range(n), range(100, 100 + n))
+    return list(self.runner._dispatch(evaluate_one, samples, config, **kwargs))
+
+  def test_results_in_input_order(self):
+    def evaluate_one(pred, gold):
+      if pred == 3:
+        raise ValueError('bad sample')
+      return pred + gold
+
+    results = self._dispatch(evaluate_one, 7, self._config(batch_size=2))
+    self.assertEqual([i for i, _, _, _ in results], list(range(7)))
+    self.assertEqual([result for _, _, result, _ in results],
+                     [100, 102, 104, None, 108, 110, 112])
+    self.assertIsInstance(results[3][3], ValueError)
+    self.assertTrue(all(error is None for i, _, _, error in results if i != 3))
+
+  def test_max_samples(self):
+    results = self._dispatch(lambda pred, gold: pred, 10,
+                             self._config(batch_size=3, max_samples=4))
+    self.assertLen(results, 4)
+
+
+  def test_batched(self):
+    chunks = []
+
+    def evaluate_chunk(pairs):
+      chunks.append(len(pairs))
+      if pairs[0][0] == 3:
+        raise ValueError('bad chunk')
+      return [pred for pred, _ in pairs]
+
+    results = self._dispatch(evaluate_chunk, 7, self._config(batch_size=3),
+                             batched=True)
+    self.assertEqual(sorted(chunks), [1, 3, 3])
+    self.assertEqual([result for _, _, result, _ in results],
+                     [0, 1, 2, None, None, None, 6])
+    self.assertEqual([error is None for _, _, _, error in results],
+                     [True, True, True, False, False, False, True])
+
+  def test_shared_executor(self):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+      results = self._dispatch(lambda pred, gold: pred, 5,
+                               self._config(batch_size=2), executor=executor)
+      # The caller's executor stays usable afterwards
+      self.assertEqual(executor.submit(int, '1').result(), 1)
+    self.assertEqual([result for _, _, result, _ in results], list(range(5)))
+
+
+if __name__ == '__main__':
+  absltest.main()
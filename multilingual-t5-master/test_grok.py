@@ -66,192 +66,1020 @@ print(f"Feedback: {result.feedback}")
     print("   Just set GROK_API_KEY and run this script again.\n")
     sys.exit(0)
 
-# If we have an API key, import and run actual tests
-print("\n" + "="*60)
-print("🚀 GROK API INTEGRATION TEST")
-print("="*60)
-print(f"API Key: {api_key[:8]}...{api_key[-4:]}")
-
+# Only API mode pays for these imports; demo mode has already exited.
 # Import the grok client directly (avoiding TensorFlow dependencies)
+import asyncio
+import contextlib
+import functools
+import hashlib
+import importlib.util
 import requests
 import json
+import logging
+import multiprocessing.util
+import queue
+import shelve
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-from dataclasses import dataclass
-from typing import Dict, Any, Optional, List
-from enum import Enum
+from dataclasses import asdict, dataclass, replace
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Dict, Any, Literal, Optional, List, Tuple, Union
+
+import numpy as np
+
+try:
+    import httpx
+except ImportError:  # Optional: falls back to requests in worker threads
+    httpx = None
+
+# HTTP/2 support in httpx needs the optional h2 package
+_HTTP2_AVAILABLE = httpx is not None and importlib.util.find_spec("h2") is not None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Optional: only needed for the semantic cache
+    SentenceTransformer = None
+
+try:
+    import onnxruntime
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from tokenizers import Tokenizer
+except ImportError:  # Optional: only needed for the int8 ONNX embedder
+    onnxruntime = None
+
+try:
+    import faiss
+except ImportError:  # Optional: the semantic cache falls back to a full scan
+    faiss = None
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:  # Optional: falls back to a characters-per-token estimate
+    tiktoken = None
+
+try:
+    import uvloop
+except ImportError:  # Optional: falls back to the default asyncio event loop
+    uvloop = None
+
+# Transient statuses retried with exponential backoff, and the pool size
+# shared by concurrent calls
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_MAX_RETRIES = 5
+_BACKOFF_FACTOR = 0.3
+_POOL_SIZE = 32
+
+# Requests in flight at once, to stay under the API rate limit
+_MAX_CONCURRENCY = 16
+
+# Prompts longer than this are rejected before any request is sent
+_MAX_INPUT_TOKENS = 4096
+
+# Past this many entries the semantic cache searches an approximate
+# IVF-PQ index instead of scanning every embedding
+_ANN_MIN_ENTRIES = 10_000
+
+# Nearest neighbours the IVF-PQ index returns, to find one in the partition
+_ANN_CANDIDATES = 16
+
+# Only near-deterministic calls are served from the caches
+_CACHEABLE_TEMPERATURE = 0.3
+
+# SimpleGrokClient methods that run_jobs() accepts as a job's task
+_JOB_TASKS = ("translate", "question_answering", "ner", "nli", "evaluate_harsh")
+
+# Exact-match responses (or in-flight requests) kept in memory per client
+_MEMO_SIZE = 4096
 
+# System messages are built once and shared by every request
+_SYS_TRANSLATE = {"role": "system", "content": "You are an expert translator. Translate accurately and naturally."}
+_SYS_QA = {"role": "system", "content": "Answer the question based on the context. Be concise."}
+_SYS_NER = {"role": "system", "content": "Extract named entities. Format: TYPE: entity $$ TYPE: entity"}
+_SYS_NLI = {"role": "system", "content": "Classify as: entailment, neutral, or contradiction. Output only the label."}
+_SYS_HARSH = {"role": "system", "content": "You are the harshest critic. Never above 8 unless perfect."}
+_SYS_BATCH = {"role": "system", "content": "For each job id, return JSON {id: result}. No prose."}
 
-class GrokModel(Enum):
-    GROK_1 = "grok-1"
-    GROK_2 = "grok-2"
-    GROK_2_MINI = "grok-2-mini"
-    GROK_BETA = "grok-beta"
 
+log = logging.getLogger("test_grok")
 
-@dataclass
+# Slotted dataclasses need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+Model = Literal["grok-1", "grok-2", "grok-2-mini", "grok-beta"]
+
+
+@dataclass(frozen=True, **_SLOTS)
 class GrokResponse:
     text: str
     model: str
     usage: Dict[str, int]
     finish_reason: str
     latency_ms: float
+    ttft_ms: Optional[float] = None  # Time to first token, for streamed responses
+
+
+@dataclass(**_SLOTS)
+class EvaluationResult:
+    score: float
+    errors: List[Any]
+    feedback: str
+    latency_ms: float
+
+
+class _StreamAccumulator:
+    """Collect server-sent chat completion chunks into a response payload."""
+    
+    def __init__(self, start_ns: int):
+        self.start_ns = start_ns
+        self.parts: List[str] = []
+        self.ttft_ms: Optional[float] = None
+        self.model = None
+        self.usage: Dict[str, int] = {}
+        self.finish_reason = "unknown"
+    
+    def feed(self, line: Union[str, bytes]):
+        """Consume one line of the event stream."""
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line.startswith("data:"):
+            return
+        payload = line[5:].strip()
+        if payload == "[DONE]":
+            return
+        chunk = _json_loads(payload)
+        self.model = chunk.get("model", self.model)
+        self.usage = chunk.get("usage") or self.usage
+        for choice in chunk.get("choices", []):
+            content = choice.get("delta", {}).get("content")
+            if content:
+                if self.ttft_ms is None:
+                    self.ttft_ms = (time.perf_counter_ns() - self.start_ns) / 1_000_000
+                self.parts.append(content)
+            if choice.get("finish_reason"):
+                self.finish_reason = choice["finish_reason"]
+    
+    def data(self) -> Dict[str, Any]:
+        """Return the stream as a non-streamed response payload."""
+        return {
+            "model": self.model,
+            "choices": [{
+                "message": {"content": "".join(self.parts)},
+                "finish_reason": self.finish_reason
+            }],
+            "usage": self.usage
+        }
+
+
+def _json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, sort_keys=sort_keys, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _encoding():
+    """Load the tokenizer once, on first use (it may need a download)."""
+    return tiktoken.get_encoding("cl100k_base")
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_tokens(text: str) -> int:
+    """Count the tokens in text, or estimate them if tiktoken is missing."""
+    if tiktoken is None:
+        return len(text) // 4 + 1  # Roughly four characters per token
+    return len(_encoding().encode(text))
+
+
+def _cache_key(body: Dict[str, Any]) -> str:
+    """Exact-match cache key for a request body."""
+    return hashlib.sha256(_json_dumps(body, sort_keys=True)).hexdigest()
+
+
+def _semantic_partition(body: Dict[str, Any]) -> int:
+    """SemanticCache partition for a request body.
+    
+    Hashes everything but the last message's text (model, temperature,
+    system prompt and any earlier turns, response format), so only prompts
+    sent with the same instructions and settings can match each other.
+    """
+    context = {**body, "messages": body["messages"][:-1]}
+    digest = hashlib.blake2b(_json_dumps(context, sort_keys=True), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> 1
+
+
+class _OnnxEmbedder:
+    """int8-quantized ONNX Runtime stand-in for SentenceTransformer.encode().
+    
+    Expects a directory exported with
+    ``optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 DIR``
+    (model.onnx plus tokenizer.json). The model is dynamically quantized to
+    model.int8.onnx on first use, and embeddings are mean-pooled over the
+    attention mask and L2-normalized like sentence-transformers does.
+    """
+    
+    def __init__(self, model_dir: str, max_length: int = 256):
+        if onnxruntime is None:
+            raise ImportError(
+                "onnxruntime and tokenizers are required for the ONNX embedder. "
+                "Install them using: pip install onnxruntime tokenizers"
+            )
+        model_dir = Path(model_dir).expanduser()
+        quantized = model_dir / "model.int8.onnx"
+        if not quantized.exists():
+            quantize_dynamic(str(model_dir / "model.onnx"), str(quantized), weight_type=QuantType.QInt8)
+        
+        options = onnxruntime.SessionOptions()
+        # One query at a time; extra threads only add synchronization overhead
+        options.intra_op_num_threads = 1
+        self.session = onnxruntime.InferenceSession(
+            str(quantized), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.tokenizer = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length)
+    
+    def get_sentence_embedding_dimension(self) -> int:
+        """Return the width of the model's hidden states."""
+        return self.session.get_outputs()[0].shape[-1]
+    
+    def encode(self, text: str, normalize_embeddings: bool = True) -> np.ndarray:
+        """Embed text by mean-pooling the final hidden states."""
+        encoding = self.tokenizer.encode(text)
+        mask = np.array([encoding.attention_mask], dtype=np.int64)
+        inputs = {
+            "input_ids": np.array([encoding.ids], dtype=np.int64),
+            "attention_mask": mask,
+            "token_type_ids": np.array([encoding.type_ids], dtype=np.int64),
+        }
+        hidden = self.session.run(None, {k: v for k, v in inputs.items() if k in self.input_names})[0][0]
+        pooled = (hidden * mask[0, :, None]).sum(axis=0) / max(mask.sum(), 1)
+        if normalize_embeddings:
+            pooled = pooled / np.linalg.norm(pooled)
+        return pooled
+
+
+class SemanticCache:
+    """Reuse responses for near-duplicate prompts.
+    
+    Prompts are embedded with a small local sentence-transformers model, and
+    a stored response is returned when its prompt's cosine similarity to the
+    new one reaches the threshold. Only entries in the same partition (see
+    _semantic_partition) are considered. Embeddings are kept in one float32
+    matrix so a lookup is a single matrix-vector product; its rows are
+    preallocated with geometric growth, so adding an entry does not copy
+    the whole matrix. Once the cache is large and faiss is installed, an
+    IVF-PQ index finds the candidates instead and only the best one is
+    re-scored exactly. The float32 matrix is kept for that re-scoring, so
+    the index makes search sub-linear but does not shrink memory. Entries
+    persist to <path>.npz (embeddings and partitions), <path>.jsonl
+    (responses) and <path>.faiss (index).
+    
+    Methods are thread-safe, so add() can run off the event loop. The index
+    is trained without holding the lock, so lookups keep being answered by
+    the flat scan while it builds.
+    """
+    
+    def __init__(
+        self,
+        path: str = "~/.grok_cache",
+        threshold: float = 0.92,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        onnx_model_dir: Optional[str] = None
+    ):
+        if onnx_model_dir is None and SentenceTransformer is None:
+            raise ImportError(
+                "sentence-transformers is required for the semantic cache. "
+                "Install it using: pip install sentence-transformers"
+            )
+        path = Path(path).expanduser()
+        self.embeddings_path = path.with_name(path.name + ".npz")
+        self.responses_path = path.with_name(path.name + ".jsonl")
+        self.index_path = path.with_name(path.name + ".faiss")
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._building = False
+        # The quantized ONNX export embeds several times faster on CPU
+        if onnx_model_dir is not None:
+            self.model = _OnnxEmbedder(onnx_model_dir)
+        else:
+            self.model = SentenceTransformer(model_name)
+        
+        dim = self.model.get_sentence_embedding_dimension()
+        # Rows [:_size] of these buffers are in use; the rest is spare capacity
+        self._embeddings = np.empty((0, dim), dtype=np.float32)
+        self._partitions = np.empty(0, dtype=np.int64)
+        self._size = 0
+        self.responses: List[GrokResponse] = []
+        if self.embeddings_path.exists() and self.responses_path.exists():
+            with np.load(self.embeddings_path) as saved:
+                self._embeddings = saved["embeddings"]
+                # Entries saved without a partition (-1) never match
+                self._partitions = (
+                    saved["partitions"] if "partitions" in saved.files
+                    else np.full(len(self._embeddings), -1, dtype=np.int64)
+                )
+            with open(self.responses_path, encoding="utf-8") as f:
+                self.responses = [GrokResponse(**json.loads(line)) for line in f]
+            # Responses are appended as they arrive but embeddings are saved
+            # on close, so an interrupted run can leave extra responses
+            del self.responses[len(self._embeddings):]
+            self._size = len(self.responses)
+        
+        self.index = None
+        if faiss is not None and self.index_path.exists():
+            self.index = faiss.read_index(str(self.index_path))
+            if self.index.ntotal != len(self.embeddings):
+                self.index = None
+        self._build_index()
+    
+    @property
+    def embeddings(self) -> np.ndarray:
+        """The stored prompt embeddings, one row per entry."""
+        return self._embeddings[:self._size]
+    
+    @property
+    def partitions(self) -> np.ndarray:
+        """The partition of each stored entry."""
+        return self._partitions[:self._size]
+    
+    def _build_index(self):
+        """Train an IVF-PQ index once the cache is large enough to need one."""
+        with self._lock:
+            if (faiss is None or self.index is not None or self._building
+                    or len(self.embeddings) < _ANN_MIN_ENTRIES):
+                return
+            self._building = True
+            embeddings = self.embeddings
+        try:
+            n, dim = embeddings.shape
+            # Each PQ sub-quantizer must cover a whole number of dimensions
+            m = next(m for m in (48, 32, 24, 16, 8, 4, 2, 1) if dim % m == 0)
+            # faiss wants about 39 training points per IVF list
+            nlist = min(1024, n // 39)
+            quantizer = faiss.IndexFlatIP(dim)
+            index = faiss.IndexIVFPQ(quantizer, dim, nlist, m, 8, faiss.METRIC_INNER_PRODUCT)
+            index.train(embeddings)
+            index.add(embeddings)
+            index.nprobe = 16
+            with self._lock:
+                # Entries added while training
+                index.add(self.embeddings[n:])
+                self.index = index
+        finally:
+            with self._lock:
+                self._building = False
+    
+    def embed(self, text: str) -> np.ndarray:
+        """Return the unit-length embedding of text."""
+        return self.model.encode(text, normalize_embeddings=True).astype(np.float32)
+    
+    def match(self, text: str, partition: int) -> Tuple[np.ndarray, Optional[GrokResponse]]:
+        """Embed text and look it up; the embedding is returned for a later add()."""
+        embedding = self.embed(text)
+        return embedding, self.lookup(embedding, partition)
+    
+    def lookup(self, embedding: np.ndarray, partition: int) -> Optional[GrokResponse]:
+        """Return the cached response for the most similar prompt in partition, if close enough."""
+        with self._lock:
+            return self._lookup(embedding, partition)
+    
+    def _lookup(self, embedding: np.ndarray, partition: int) -> Optional[GrokResponse]:
+        if not self.responses:
+            return None
+        if self.index is not None:
+            # PQ scores are approximate, so re-score the best candidate exactly
+            _, ids = self.index.search(embedding.reshape(1, -1), _ANN_CANDIDATES)
+            best = next((int(i) for i in ids[0] if i >= 0 and self.partitions[i] == partition), -1)
+            if best < 0 or float(self.embeddings[best] @ embedding) < self.threshold:
+                return None
+        else:
+            sims = np.where(self.partitions == partition, self.embeddings @ embedding, -np.inf)
+            best = int(sims.argmax())
+            if sims[best] < self.threshold:
+                return None
+        return replace(self.responses[best], latency_ms=0.0)
+    
+    def add(self, embedding: np.ndarray, partition: int, response: GrokResponse):
+        """Store a response under its prompt embedding and partition.
+        
+        Trains the index when the cache first reaches _ANN_MIN_ENTRIES,
+        which takes seconds, so async callers run this in a thread.
+        """
+        with self._lock:
+            n = self._size
+            if n == len(self._embeddings):
+                # Double the capacity so appends are amortized O(1)
+                capacity = max(64, 2 * n)
+                embeddings = np.empty((capacity, self._embeddings.shape[1]), dtype=np.float32)
+                embeddings[:n] = self._embeddings[:n]
+                partitions = np.empty(capacity, dtype=np.int64)
+                partitions[:n] = self._partitions[:n]
+                self._embeddings, self._partitions = embeddings, partitions
+            self._embeddings[n] = embedding
+            self._partitions[n] = partition
+            self._size = n + 1
+            self.responses.append(response)
+            if self.index is not None:
+                self.index.add(embedding.reshape(1, -1))
+            with open(self.responses_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(response)) + "\n")
+        self._build_index()
+    
+    def save(self):
+        """Write the embedding matrix and partitions (and index, if built) to disk."""
+        with self._lock:
+            np.savez(self.embeddings_path, embeddings=self.embeddings, partitions=self.partitions)
+            if self.index is not None:
+                faiss.write_index(self.index, str(self.index_path))
 
 
 class SimpleGrokClient:
     """Simplified Grok client for testing."""
     
-    def __init__(self, api_key: str, model: str = "grok-2"):
+    def __init__(
+        self,
+        api_key: str,
+        model: Model = "grok-2",
+        semantic_cache: Optional[SemanticCache] = None,
+        disk_cache: Optional[str] = None,
+        cache_ttl: float = 24 * 3600,
+        stream: bool = False,
+        max_concurrency: int = _MAX_CONCURRENCY,
+        max_input_tokens: int = _MAX_INPUT_TOKENS
+    ):
         self.api_key = api_key
         self.model = model
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.max_input_tokens = max_input_tokens
+        # Receive completions as server-sent events and record time to first token
+        self.stream = stream
+        self.semantic_cache = semantic_cache
+        # Exact-match responses for low-temperature calls, keyed by payload hash
+        self.disk_cache = shelve.open(disk_cache) if disk_cache else None
+        self.cache_ttl = cache_ttl
+        # LRU of in-process results for the same calls, as tasks so that
+        # concurrent duplicates share one request
+        self._memo: "OrderedDict[str, asyncio.Task]" = OrderedDict()
         self.base_url = "https://api.x.ai/v1"
-        self.session = requests.Session()
-        self.session.headers.update({
+        headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
-        })
+        }
+        if httpx is not None:
+            # One pooled (and, with h2, multiplexed) connection set shared by
+            # all concurrent calls
+            self.session = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                headers=headers,
+                timeout=60,
+                limits=httpx.Limits(max_connections=_POOL_SIZE, max_keepalive_connections=_POOL_SIZE)
+            )
+        else:
+            self.session = requests.Session()
+            retry = Retry(
+                total=_MAX_RETRIES,
+                backoff_factor=_BACKOFF_FACTOR,
+                status_forcelist=_RETRY_STATUSES,
+                allowed_methods=["POST"],
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=retry)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.session.headers.update(headers)
+    
+    async def aclose(self):
+        """Close the underlying HTTP session and save the caches."""
+        if self.disk_cache is not None:
+            self.disk_cache.close()
+        if self.semantic_cache is not None:
+            self.semantic_cache.save()
+        if httpx is not None:
+            await self.session.aclose()
+        else:
+            self.session.close()
     
-    def _call(self, messages: List[Dict], max_tokens: int = 1024, temperature: float = 0.7) -> GrokResponse:
-        start = time.time()
+    async def _acall(
+        self,
+        messages: List[Dict],
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        response_format: Optional[Dict[str, str]] = None
+    ) -> GrokResponse:
+        # Fail fast on oversized prompts instead of paying for a round trip
+        # (and server-side prefill) that would be rejected or truncated
+        n_tokens = sum(_count_tokens(m["content"]) for m in messages)
+        if n_tokens > self.max_input_tokens:
+            raise ValueError(f"Prompt has {n_tokens} tokens, more than max_input_tokens={self.max_input_tokens}")
         
-        response = self.session.post(
-            f"{self.base_url}/chat/completions",
-            json={
-                "model": self.model,
-                "messages": messages,
-                "max_tokens": max_tokens,
-                "temperature": temperature
-            },
-            timeout=60
-        )
+        body = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+        if response_format is not None:
+            body["response_format"] = response_format
+        
+        if temperature > _CACHEABLE_TEMPERATURE:
+            return await self._fetch(body, None)
+        
+        # Identical near-deterministic calls in this session reuse the first
+        # one's result, or wait on its request if it is still in flight
+        key = _cache_key(body)
+        task = self._memo.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(body, key))
+            self._memo[key] = task
+            if len(self._memo) > _MEMO_SIZE:
+                self._memo.popitem(last=False)
+        else:
+            self._memo.move_to_end(key)
+        try:
+            # Shielded so one cancelled caller does not cancel the others
+            return await asyncio.shield(task)
+        except Exception:
+            # Failures are not memoized; the next identical call retries
+            if self._memo.get(key) is task:
+                del self._memo[key]
+            raise
+    
+    async def _fetch(self, body: Dict[str, Any], key: Optional[str]) -> GrokResponse:
+        """Answer a request body from the caches or the API.
         
-        latency = (time.time() - start) * 1000
+        key is the body's exact-match cache key, or None when the call is
+        too random to cache (which bypasses the semantic cache as well).
+        """
+        messages = body["messages"]
+        url = f"{self.base_url}/chat/completions"
+        
+        # L1: exact payload match, then L2: semantically similar prompt
+        if key is not None and self.disk_cache is not None:
+            entry = self.disk_cache.get(key)
+            if entry is not None and time.time() - entry["time"] < self.cache_ttl:
+                return replace(GrokResponse(**entry["response"]), latency_ms=0.0)
+        embedding = None
+        if key is not None and self.semantic_cache is not None:
+            partition = _semantic_partition(body)
+            # Embedding runs the model, so keep it (and the search) off the loop
+            embedding, cached = await asyncio.to_thread(
+                self.semantic_cache.match, messages[-1]["content"], partition
+            )
+            if cached is not None:
+                return cached
+        
+        # The cache key above is computed without the stream flag, so
+        # streamed and buffered calls share cache entries
+        payload = _json_dumps({**body, "stream": True} if self.stream else body)
+        
+        async with self._semaphore:
+            start, response, stream = await self._send(url, payload)
+        
+        latency = (time.perf_counter_ns() - start) / 1_000_000
         
         if response.status_code != 200:
             raise Exception(f"API Error {response.status_code}: {response.text}")
         
-        data = response.json()
+        data = stream.data() if stream is not None else _json_loads(response.content)
         
-        return GrokResponse(
+        result = GrokResponse(
             text=data["choices"][0]["message"]["content"],
             model=data["model"],
             usage=data.get("usage", {}),
             finish_reason=data["choices"][0].get("finish_reason", "unknown"),
-            latency_ms=latency
+            latency_ms=latency,
+            ttft_ms=stream.ttft_ms if stream is not None else None
         )
+        if key is not None and self.disk_cache is not None:
+            self.disk_cache[key] = {"response": asdict(result), "time": time.time()}
+        if embedding is not None:
+            # Off the event loop: the first add past _ANN_MIN_ENTRIES trains the index
+            await asyncio.to_thread(self.semantic_cache.add, embedding, partition, result)
+        return result
     
-    def translate(self, text: str, source: str, target: str) -> GrokResponse:
-        messages = [
-            {"role": "system", "content": "You are an expert translator. Translate accurately and naturally."},
+    async def _send(self, url: str, payload: bytes) -> Tuple[int, Any, Optional[_StreamAccumulator]]:
+        """POST an encoded payload, retrying transient errors.
+        
+        Returns the perf_counter_ns() start of the last attempt, the
+        response, and the accumulated stream when streaming.
+        """
+        stream = None
+        
+        # Latency is timed with the monotonic perf counter from the start of
+        # the last attempt, so backoff sleeps are not counted
+        if httpx is not None:
+            # httpx does not retry, so back off on transient statuses and on
+            # connection errors and timeouts here the way the requests
+            # adapter's Retry does
+            for attempt in range(_MAX_RETRIES + 1):
+                start = time.perf_counter_ns()
+                request = self.session.build_request("POST", url, content=payload)
+                try:
+                    response = await self.session.send(request, stream=self.stream)
+                except httpx.TransportError:
+                    if attempt == _MAX_RETRIES:
+                        raise
+                    await asyncio.sleep(_BACKOFF_FACTOR * 2 ** attempt)
+                    continue
+                if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                    break
+                await response.aclose()
+                await asyncio.sleep(_BACKOFF_FACTOR * 2 ** attempt)
+            try:
+                if response.status_code != 200:
+                    await response.aread()
+                elif self.stream:
+                    stream = _StreamAccumulator(start)
+                    async for line in response.aiter_lines():
+                        stream.feed(line)
+            finally:
+                await response.aclose()
+        else:
+            # requests blocks, so run it (and any stream reading) off the event loop
+            def post():
+                start = time.perf_counter_ns()
+                response = self.session.post(url, data=payload, timeout=60, stream=self.stream)
+                stream = None
+                if response.status_code == 200 and self.stream:
+                    stream = _StreamAccumulator(start)
+                    for line in response.iter_lines():
+                        stream.feed(line)
+                return start, response, stream
+            start, response, stream = await asyncio.to_thread(post)
+        return start, response, stream
+    
+    async def translate(self, text: str, source: str, target: str) -> GrokResponse:
+        return await self._acall(self._translate_messages(text, source, target), temperature=0.3)
+    
+    async def question_answering(self, question: str, context: str) -> GrokResponse:
+        return await self._acall(self._question_answering_messages(question, context), temperature=0.1)
+    
+    async def ner(self, text: str) -> GrokResponse:
+        return await self._acall(self._ner_messages(text), temperature=0.1)
+    
+    async def nli(self, premise: str, hypothesis: str) -> GrokResponse:
+        return await self._acall(self._nli_messages(premise, hypothesis), temperature=0.1, max_tokens=20)
+    
+    async def evaluate_harsh(self, task: str, input_data: Dict) -> EvaluationResult:
+        # JSON mode guarantees a bare JSON object, with no prose or fences to strip
+        response = await self._acall(
+            self._evaluate_harsh_messages(task, input_data),
+            temperature=0.2,
+            response_format={"type": "json_object"}
+        )
+        parsed = _json_loads(response.text)
+        if "score" not in parsed:
+            raise ValueError(f"Evaluation has no score: {response.text[:200]}")
+        errors = parsed.get("errors") or []
+        return EvaluationResult(
+            score=float(parsed["score"]),
+            errors=[errors] if isinstance(errors, str) else list(errors),
+            feedback=str(parsed.get("feedback", "")),
+            latency_ms=response.latency_ms
+        )
+    
+    # Message builders, shared by the task methods and batch_job()
+    
+    def _translate_messages(self, text: str, source: str, target: str) -> List[Dict]:
+        return [
+            _SYS_TRANSLATE,
             {"role": "user", "content": f"Translate from {source} to {target}:\n\n{text}"}
         ]
-        return self._call(messages, temperature=0.3)
     
-    def question_answering(self, question: str, context: str) -> GrokResponse:
-        messages = [
-            {"role": "system", "content": "Answer the question based on the context. Be concise."},
+    def _question_answering_messages(self, question: str, context: str) -> List[Dict]:
+        return [
+            _SYS_QA,
             {"role": "user", "content": f"Context: {context}\n\nQuestion: {question}"}
         ]
-        return self._call(messages, temperature=0.1)
     
-    def ner(self, text: str) -> GrokResponse:
-        messages = [
-            {"role": "system", "content": "Extract named entities. Format: TYPE: entity $$ TYPE: entity"},
+    def _ner_messages(self, text: str) -> List[Dict]:
+        return [
+            _SYS_NER,
             {"role": "user", "content": f"Extract entities from: {text}"}
         ]
-        return self._call(messages, temperature=0.1)
     
-    def nli(self, premise: str, hypothesis: str) -> GrokResponse:
-        messages = [
-            {"role": "system", "content": "Classify as: entailment, neutral, or contradiction. Output only the label."},
+    def _nli_messages(self, premise: str, hypothesis: str) -> List[Dict]:
+        return [
+            _SYS_NLI,
             {"role": "user", "content": f"Premise: {premise}\nHypothesis: {hypothesis}"}
         ]
-        return self._call(messages, temperature=0.1, max_tokens=20)
     
-    def evaluate_harsh(self, task: str, input_data: Dict) -> Dict:
+    def _evaluate_harsh_messages(self, task: str, input_data: Dict) -> List[Dict]:
         prompt = f"""Evaluate this {task} with EXTREME strictness (0-10 scale, be harsh):
 
-{json.dumps(input_data, indent=2)}
+{_json_dumps(input_data).decode()}
 
 Respond in JSON with: score, errors, feedback"""
         
-        messages = [
-            {"role": "system", "content": "You are the world's harshest critic. Never give above 8 unless perfect."},
+        return [
+            _SYS_HARSH,
             {"role": "user", "content": prompt}
         ]
+    
+    def batch_job(self, job_id: str, task_fn, *args, **kwargs) -> Dict[str, str]:
+        """Build a batch() job from a task method and the arguments it would take."""
+        messages = getattr(self, f"_{task_fn.__name__}_messages")(*args, **kwargs)
+        return {"id": job_id, "prompt": "\n\n".join(m["content"] for m in messages)}
+    
+    async def batch(self, jobs: List[Dict[str, str]]) -> List[GrokResponse]:
+        """Run several jobs in one chat completion instead of one request each.
+        
+        The model answers with a JSON object mapping each job id to its
+        result; every returned GrokResponse shares the single call's latency
+        and usage.
+        """
+        messages = [
+            _SYS_BATCH,
+            {"role": "user", "content": _json_dumps(jobs).decode()}
+        ]
+        response = await self._acall(
+            messages, max_tokens=2048, temperature=0.2, response_format={"type": "json_object"}
+        )
+        
+        results = _json_loads(response.text)
+        missing = [job["id"] for job in jobs if job["id"] not in results]
+        if missing:
+            raise ValueError(f"Batch response is missing jobs: {missing}")
         
-        response = self._call(messages, temperature=0.2)
-        return {"raw": response.text, "latency_ms": response.latency_ms}
+        responses = []
+        for job in jobs:
+            result = results[job["id"]]
+            text = result if isinstance(result, str) else _json_dumps(result).decode()
+            responses.append(replace(response, text=text))
+        return responses
+
+@contextlib.contextmanager
+def _queued_logging():
+    """Route test output through a queue so console writes happen on a
+    background thread instead of blocking the event loop."""
+    records = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(records, console)
+    handler = QueueHandler(records)
+    level, propagate = log.level, log.propagate
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    listener.start()
+    try:
+        yield
+    finally:
+        # Stopping the listener flushes any queued output
+        listener.stop()
+        log.removeHandler(handler)
+        log.setLevel(level)
+        log.propagate = propagate
 
 
-def run_tests():
-    """Run all tests."""
-    client = SimpleGrokClient(api_key)
+async def run_tests(
+    batched: bool = False,
+    semantic_cache: Optional[str] = None,
+    disk_cache: Optional[str] = None,
+    stream: bool = False,
+    onnx_embedder: Optional[str] = None
+):
+    """Run all tests, then print their results in order.
     
-    print("\n" + "-"*60)
-    print("📝 TEST 1: Translation")
-    print("-"*60)
-    try:
-        response = client.translate("Hello, how are you?", "en", "es")
-        print(f"✅ EN → ES: {response.text}")
-        print(f"   Latency: {response.latency_ms:.0f}ms")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    print("\n" + "-"*60)
-    print("❓ TEST 2: Question Answering")
-    print("-"*60)
-    try:
-        response = client.question_answering(
+    Args:
+        batched: Send all tests as one batch() request instead of five
+                 concurrent requests.
+        semantic_cache: Path prefix of a SemanticCache to answer
+                        near-duplicate prompts from, or None to always call
+                        the API.
+        disk_cache: Path of a shelve file caching exact low-temperature
+                    requests, or None to disable it.
+        stream: Stream the completions and report time to first token.
+        onnx_embedder: Directory of an ONNX export of the semantic cache's
+                       embedding model, to embed with int8 ONNX Runtime
+                       instead of sentence-transformers.
+    """
+    with _queued_logging():
+        await _run_tests(batched, semantic_cache, disk_cache, stream, onnx_embedder)
+
+
+async def _run_tests(
+    batched: bool,
+    semantic_cache: Optional[str],
+    disk_cache: Optional[str],
+    stream: bool,
+    onnx_embedder: Optional[str]
+):
+    # Each block goes out as one multi-line record rather than a print per line
+    rule = "="*60
+    log.info("\n%s\n🚀 GROK API INTEGRATION TEST\n%s\nAPI Key: %s...%s", rule, rule, api_key[:8], api_key[-4:])
+    
+    cache = SemanticCache(semantic_cache, onnx_model_dir=onnx_embedder) if semantic_cache else None
+    client = SimpleGrokClient(api_key, semantic_cache=cache, disk_cache=disk_cache, stream=stream)
+    
+    tests = [
+        ("📝 TEST 1: Translation", "EN → ES", functools.partial(
+            client.translate, "Hello, how are you?", "en", "es"
+        )),
+        ("❓ TEST 2: Question Answering", "Answer", functools.partial(
+            client.question_answering,
             question="What is the capital of France?",
             context="France is a beautiful country in Western Europe. Its capital city is Paris, known for the Eiffel Tower."
-        )
-        print(f"✅ Answer: {response.text}")
-        print(f"   Latency: {response.latency_ms:.0f}ms")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    print("\n" + "-"*60)
-    print("🏷️ TEST 3: Named Entity Recognition")
-    print("-"*60)
-    try:
-        response = client.ner("Elon Musk founded SpaceX in Hawthorne, California.")
-        print(f"✅ Entities: {response.text}")
-        print(f"   Latency: {response.latency_ms:.0f}ms")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    print("\n" + "-"*60)
-    print("🔍 TEST 4: Natural Language Inference")
-    print("-"*60)
-    try:
-        response = client.nli(
+        )),
+        ("🏷️ TEST 3: Named Entity Recognition", "Entities", functools.partial(
+            client.ner,
+            "Elon Musk founded SpaceX in Hawthorne, California."
+        )),
+        ("🔍 TEST 4: Natural Language Inference", "Classification", functools.partial(
+            client.nli,
             premise="A man is playing guitar.",
             hypothesis="Someone is making music."
-        )
-        print(f"✅ Classification: {response.text}")
-        print(f"   Latency: {response.latency_ms:.0f}ms")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-    
-    print("\n" + "-"*60)
-    print("⚖️ TEST 5: Harsh Evaluation")
-    print("-"*60)
-    try:
-        result = client.evaluate_harsh("translation", {
+        )),
+        ("⚖️ TEST 5: Harsh Evaluation", "Evaluation", functools.partial(client.evaluate_harsh, "translation", {
             "source": "The quick brown fox jumps over the lazy dog.",
             "translation": "El rápido zorro marrón salta sobre el perro perezoso.",
             "source_lang": "en",
             "target_lang": "es"
-        })
-        print(f"✅ Evaluation:\n{result['raw'][:500]}")
-        print(f"   Latency: {result['latency_ms']:.0f}ms")
-    except Exception as e:
-        print(f"❌ Error: {e}")
+        })),
+    ]
     
-    print("\n" + "="*60)
-    print("✅ ALL TESTS COMPLETED!")
-    print("="*60 + "\n")
+    try:
+        if batched:
+            jobs = [
+                client.batch_job(str(n), call.func, *call.args, **call.keywords)
+                for n, (_, _, call) in enumerate(tests, 1)
+            ]
+            try:
+                results = await client.batch(jobs)
+            except Exception as e:
+                results = [e] * len(tests)
+        else:
+            # The calls are network-bound, so total wall time is the slowest
+            # call rather than the sum of all five
+            results = await asyncio.gather(*(call() for _, _, call in tests), return_exceptions=True)
+    finally:
+        await client.aclose()
+    
+    for (title, label, _), result in zip(tests, results):
+        lines = ["", "-"*60, title, "-"*60]
+        if isinstance(result, Exception):
+            lines.append(f"❌ Error: {result}")
+        elif isinstance(result, EvaluationResult):
+            lines.append(f"✅ {label}: {result.score:g}/10")
+            lines.extend(f"   - {error}" for error in result.errors)
+            lines.append(f"   Feedback: {result.feedback}")
+            lines.append(f"   Latency: {result.latency_ms:.0f}ms")
+        else:
+            lines.append(f"✅ {label}: {result.text}")
+            lines.append(f"   Latency: {result.latency_ms:.0f}ms")
+            if result.ttft_ms is not None:
+                lines.append(f"   Time to first token: {result.ttft_ms:.0f}ms")
+        log.info("\n".join(lines))
+    
+    log.info("\n%s\n✅ ALL TESTS COMPLETED!\n%s\n", rule, rule)
+
+
+# SimpleGrokClient arguments of a run_jobs() worker process, set by _init_worker()
+# A run_jobs() worker process's event loop and client, set up once by
+# _init_worker() and reused by every chunk the process runs
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_client: Optional["SimpleGrokClient"] = None
+
+
+def _init_worker(client_kwargs: Dict[str, Any]):
+    """ProcessPoolExecutor initializer: open the process's event loop and client."""
+    global _worker_loop, _worker_client
+    if uvloop is not None:
+        # Set here as well: the parent's policy does not carry over to
+        # spawned workers
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+    _worker_client = SimpleGrokClient(**client_kwargs)
+    # Pool workers leave through os._exit(), which skips atexit handlers
+    # but not multiprocessing's own finalizers
+    multiprocessing.util.Finalize(None, _close_worker, exitpriority=10)
+
+
+def _close_worker():
+    _worker_loop.run_until_complete(_worker_client.aclose())
+    _worker_loop.close()
+
+
+async def _run_chunk(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def run(job):
+        if job.get("task") not in _JOB_TASKS:
+            raise ValueError(f"Unknown task: {job.get('task')!r}")
+        return await getattr(_worker_client, job["task"])(**job.get("args", {}))
+    
+    results = await asyncio.gather(*(run(job) for job in jobs), return_exceptions=True)
+    
+    records = []
+    for job, result in zip(jobs, results):
+        record = {"id": job.get("id"), "task": job.get("task")}
+        if isinstance(result, Exception):
+            record["error"] = str(result)
+        else:
+            record.update(asdict(result))
+        records.append(record)
+    return records
+
+
+def run_chunk(jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Run a chunk of jobs concurrently in this process.
+    
+    Used as the ProcessPoolExecutor worker by run_jobs(). Chunks run on the
+    process's long-lived loop and client from _init_worker(), so connections
+    and the in-process memo carry over between chunks and nothing but the
+    job dicts is pickled per chunk.
+    """
+    return _worker_loop.run_until_complete(_run_chunk(jobs))
+
+
+def run_jobs(
+    jobs_path: str,
+    output_path: str,
+    api_key: str,
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+    **client_kwargs
+):
+    """Run a JSONL file of jobs across worker processes.
+    
+    Each job is {"id": ..., "task": <SimpleGrokClient method>, "args": {...}}.
+    Chunks of jobs are spread over processes, and the jobs within a chunk
+    run concurrently on that process's event loop, so response parsing and
+    result construction are not serialized on one GIL.
+    
+    Args:
+        jobs_path: JSONL file with one job per line.
+        output_path: JSONL file to write one result per job to, in order.
+        api_key: Grok API key for the workers' clients.
+        workers: Number of processes (default: os.cpu_count()).
+        chunksize: Jobs per chunk handed to a worker.
+        **client_kwargs: Further SimpleGrokClient arguments (e.g. model).
+                         max_concurrency is the total across all workers
+                         and is split evenly between them.
+    """
+    with open(jobs_path, encoding="utf-8") as f:
+        jobs = [_json_loads(line) for line in f if line.strip()]
+    chunks = [jobs[i:i + chunksize] for i in range(0, len(jobs), chunksize)]
+    
+    failed = 0
+    workers = workers or os.cpu_count() or 1
+    # Passed to each worker once, rather than read from this module's globals
+    client_kwargs["api_key"] = api_key
+    client_kwargs["max_concurrency"] = max(1, client_kwargs.get("max_concurrency", _MAX_CONCURRENCY) // workers)
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(client_kwargs,))
+    with executor, open(output_path, "wb") as out:
+        for records in executor.map(run_chunk, chunks):
+            for record in records:
+                failed += "error" in record
+                out.write(_json_dumps(record) + b"\n")
+    log.info("✅ %d jobs done (%d failed), results in %s", len(jobs), failed, output_path)
 
 
 if __name__ == "__main__":
-    run_tests()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Grok API integration test")
+    parser.add_argument("--batch", action="store_true",
+                        help="Send all tests as a single request")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream completions and report time to first token")
+    parser.add_argument("--cache", nargs="?", const=".grok_cache.db", metavar="PATH",
+                        help="Reuse responses to identical low-temperature requests (default: .grok_cache.db)")
+    parser.add_argument("--semantic-cache", nargs="?", const="~/.grok_cache", metavar="PATH",
+                        help="Answer near-duplicate prompts from a local cache (default: ~/.grok_cache)")
+    parser.add_argument("--onnx-embedder", metavar="DIR",
+                        help="Embed semantic cache prompts with an int8-quantized ONNX export in DIR")
+    parser.add_argument("--jobs", metavar="FILE",
+                        help="Run the jobs in a JSONL file across worker processes instead of the tests")
+    parser.add_argument("--output", default="grok_results.jsonl", metavar="FILE",
+                        help="Where --jobs writes its results (default: grok_results.jsonl)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Worker processes for --jobs (default: CPU count)")
+    args = parser.parse_args()
+    
+    if uvloop is not None:
+        # libuv's event loop schedules many small HTTP calls more cheaply
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    if args.jobs:
+        with _queued_logging():
+            run_jobs(args.jobs, args.output, api_key, workers=args.workers)
+        sys.exit(0)
+    asyncio.run(run_tests(batched=args.batch, semantic_cache=args.semantic_cache, disk_cache=args.cache,
+                          stream=args.stream, onnx_embedder=args.onnx_embedder))